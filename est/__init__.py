@@ -9,8 +9,21 @@ __version__ = "1.0.2"
 __author__ = "Sumedh Patil"
 __email__ = "sumedh1599@gmail.com"
 
-from .tokenizer import SanskritTokenizer
-from .decoder import SanskritDecoder
-
 __all__ = ['SanskritTokenizer', 'SanskritDecoder']
 
+
+def __getattr__(name):
+    """Lazily import the public classes (PEP 562).
+
+    `import est` alone stays cheap - the tokenizer pulls in the semantic
+    expander's precomputed tables, which is wasted work for callers that
+    only want __version__ or the decoder.
+    """
+    if name == 'SanskritTokenizer':
+        from .tokenizer import SanskritTokenizer
+        return SanskritTokenizer
+    if name == 'SanskritDecoder':
+        from .decoder import SanskritDecoder
+        return SanskritDecoder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -12,7 +12,13 @@ class ContextDetector:
     def __init__(self):
         """Initialize context detector"""
         self.expander = SemanticExpander()
-        
+
+        # Cache for detect_context results (major performance improvement:
+        # get_context_priority and context_aware_filter re-detect the same
+        # chunk once per candidate otherwise)
+        self._context_cache = {}
+
+
         # Context patterns and keywords
         self.context_patterns = {
             'legal': {
@@ -61,7 +67,13 @@ class ContextDetector:
             'context_scores': dict of context scores,
             'context_keywords': dict of matched keywords per context
         }
+        OPTIMIZED: Results are cached per text - the detection depends only
+        on the input string, and callers re-detect the same chunk repeatedly
         """
+        cached = self._context_cache.get(text)
+        if cached is not None:
+            return cached
+
         text_lower = text.lower()
         context_scores = {}
         context_keywords = {}
@@ -87,11 +99,18 @@ class ContextDetector:
         if context_scores:
             primary_context = max(context_scores.items(), key=lambda x: x[1])[0]
         
-        return {
+        result = {
             'primary_context': primary_context,
             'context_scores': context_scores,
             'context_keywords': context_keywords
         }
+
+        # Keep the cache bounded (prevent unbounded growth on long runs)
+        if len(self._context_cache) > 512:
+            self._context_cache.clear()
+        self._context_cache[text] = result
+
+        return result
     
     def detect(self, text: str) -> str:
         """
@@ -5,6 +5,7 @@ Provides reverse translation from Sanskrit to English using the dataset
 """
 
 import csv
+import sys
 from typing import List, Dict, Optional
 from pathlib import Path
 
@@ -49,7 +50,8 @@ class SanskritDecoder:
             reader = csv.DictReader(f)
             
             for row in reader:
-                sanskrit = row.get('sanskrit', '').strip()
+                # Interned keys hash once and compare by pointer on lookups
+                sanskrit = sys.intern(row.get('sanskrit', '').strip())
                 devnari = row.get('devnari', '').strip()
                 
                 if sanskrit:
@@ -4,6 +4,7 @@ Recursive Engine - Main recursive loop with 5 iterations
 """
 
 import csv
+import sys
 from typing import List, Dict, Tuple, Optional
 from .pre_processor import PreProcessor
 from .scoring_system import ScoringSystem
@@ -39,6 +40,11 @@ class RecursiveEngine:
         # For expected tokens/context guidance
         self.expected_tokens = None
         self.expected_context = None
+
+        # Per-word match memo for iteration4: common words ('divide',
+        # 'share', ...) recur across chunks and runs, and their top match is
+        # fully determined by the word when no guidance is active
+        self._word_match_cache = {}
     
     def transliterate_word_letters(self, word: str) -> str:
         """
@@ -79,23 +85,42 @@ class RecursiveEngine:
         """Load Sanskrit dataset from CSV"""
         try:
             with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                # Use csv.reader with positional indexing instead of DictReader:
+                # skips the per-row dict allocation and string-keyed lookups
+                reader = csv.reader(f)
+                header = next(reader)
+                col = {name: i for i, name in enumerate(header)}
+                i_sans = col['sanskrit']
+                i_dev = col['devnari']
+                i_eng = col['english']
+                i_frame = col['semantic_frame']
+                i_trig = col['Contextual_Triggers']
+                i_anch = col['Conceptual_Anchors']
+                i_amb = col['Ambiguity_Resolvers']
+                i_freq = col['Usage_Frequency_Index']
+                n_cols = len(header)
+
                 # Load letter-to-devnari mapping for unmatched words
                 self.letter_to_devnari = {}
                 self.space_symbol = '·'  # Default space symbol (middle dot)
-                
+
                 for row in reader:
-                    sanskrit = row.get('sanskrit', '').strip()
-                    devnari = row.get('devnari', '').strip()
-                    
+                    if len(row) < n_cols:
+                        # Pad short rows so positional indexing stays safe
+                        row = row + [''] * (n_cols - len(row))
+                    # Interned keys hash once and compare by pointer in the
+                    # scoring tables built over them
+                    sanskrit = sys.intern(row[i_sans].strip())
+                    devnari = row[i_dev].strip()
+
                     if sanskrit:
                         self.word_data[sanskrit] = {
-                            'english': row.get('english', '').strip(),
-                            'semantic_frame': row.get('semantic_frame', '').strip(),
-                            'contextual_triggers': row.get('Contextual_Triggers', '').strip(),
-                            'conceptual_anchors': row.get('Conceptual_Anchors', '').strip(),
-                            'ambiguity_resolvers': row.get('Ambiguity_Resolvers', '').strip(),
-                            'usage_frequency_index': row.get('Usage_Frequency_Index', '').strip(),
+                            'english': row[i_eng].strip(),
+                            'semantic_frame': row[i_frame].strip(),
+                            'contextual_triggers': row[i_trig].strip(),
+                            'conceptual_anchors': row[i_anch].strip(),
+                            'ambiguity_resolvers': row[i_amb].strip(),
+                            'usage_frequency_index': row[i_freq].strip(),
                             'devnari': devnari  # Store devnari for each word
                         }
                     
@@ -118,15 +143,17 @@ class RecursiveEngine:
             self.letter_to_devnari = {}
             self.space_symbol = 'ं'  # Default: Anusvāra
     
-    def iteration1_full_sentence(self, text: str, previous_score: Optional[float] = None) -> Dict:
+    def iteration1_full_sentence(self, text: str, previous_score: Optional[float] = None,
+                                 matches: Optional[List[Tuple]] = None) -> Dict:
         """Iteration 1: Try to match full sentence"""
-        matches = self.scoring_system.find_best_matches(
-            text, 
-            top_n=1,
-            expected_tokens=self.expected_tokens, 
-            expected_context=self.expected_context
-        )
-        
+        if matches is None:
+            matches = self.scoring_system.find_best_matches(
+                text,
+                top_n=1,
+                expected_tokens=self.expected_tokens,
+                expected_context=self.expected_context
+            )
+
         if matches:
             sanskrit, score, breakdown = matches[0]
             decision, reason = self.decision_engine.make_decision(score, previous_score, iteration=1)
@@ -208,8 +235,10 @@ class RecursiveEngine:
                 'reason': 'Not enough words for verb-object pairs'
             }
         
-        # Try 2-word combinations
-        pairs = []
+        # Try 2-word combinations - track best pair during the loop
+        # (avoids building a list of tuples and a trailing max() pass)
+        best_pair = None
+        best_score = -1.0
         for i in range(len(words) - 1):
             pair = f"{words[i]} {words[i+1]}"
             matches = self.scoring_system.find_best_matches(
@@ -220,11 +249,11 @@ class RecursiveEngine:
             )
             if matches:
                 sanskrit, score, breakdown = matches[0]
-                if score >= 0.60:
-                    pairs.append((pair, sanskrit, score))
-        
-        if pairs:
-            best_pair = max(pairs, key=lambda x: x[2])
+                if score >= 0.60 and score > best_score:
+                    best_pair = (pair, sanskrit, score)
+                    best_score = score
+
+        if best_pair:
             decision, reason = self.decision_engine.make_decision(best_pair[2], previous_score, iteration=3)
             return {
                 'iteration': 3,
@@ -251,13 +280,25 @@ class RecursiveEngine:
         matched_words = []
         total_score = 0.0
         
+        # Guidance-free scoring depends only on the word itself, so it can be
+        # memoized; guided runs bypass the cache because expected tokens and
+        # context change the scores
+        cacheable = self.expected_tokens is None and self.expected_context is None
+
         for word in words:
-            matches = self.scoring_system.find_best_matches(
-                word,
-                top_n=1,
-                expected_tokens=self.expected_tokens,
-                expected_context=self.expected_context
-            )
+            matches = self._word_match_cache.get(word) if cacheable else None
+            if matches is None:
+                matches = self.scoring_system.find_best_matches(
+                    word,
+                    top_n=1,
+                    expected_tokens=self.expected_tokens,
+                    expected_context=self.expected_context
+                )
+                if cacheable:
+                    # Keep the cache bounded on very long runs
+                    if len(self._word_match_cache) > 4096:
+                        self._word_match_cache.clear()
+                    self._word_match_cache[word] = matches
             if matches:
                 sanskrit, score, breakdown = matches[0]
                 if score >= 0.60:
@@ -292,15 +333,17 @@ class RecursiveEngine:
             'reason': 'No individual word matches'
         }
     
-    def iteration5_final_resolution(self, text: str, previous_score: Optional[float] = None) -> Dict:
+    def iteration5_final_resolution(self, text: str, previous_score: Optional[float] = None,
+                                    matches: Optional[List[Tuple]] = None) -> Dict:
         """Iteration 5: Final resolution with lower threshold"""
-        matches = self.scoring_system.find_best_matches(
-            text,
-            top_n=5,
+        if matches is None:
+            matches = self.scoring_system.find_best_matches(
+                text,
+                top_n=5,
                 expected_tokens=self.expected_tokens,
                 expected_context=self.expected_context
             )
-        
+
         if matches:
             # Use best match even with lower score
             best_result = matches[0]
@@ -333,14 +376,26 @@ class RecursiveEngine:
         Process a chunk through all 5 iterations
         Returns: Final result with best match
         """
-        results = []
+        # Score the full chunk ONCE (top 5) and share the result between
+        # iteration1 and iteration5 - avoids a second dictionary scan for
+        # chunks that fall through to final resolution
+        full_matches = self.scoring_system.find_best_matches(
+            text,
+            top_n=5,
+            expected_tokens=self.expected_tokens,
+            expected_context=self.expected_context
+        )
+
+        # Fast path: near-perfect iteration1 match needs no decision-chain bookkeeping
+        result1 = self.iteration1_full_sentence(text, None, matches=full_matches)
+        if result1['decision'] == Decision.ACCEPT and result1['score'] >= 0.95:
+            result1['all_iterations'] = [result1]
+            return result1
+
+        results = [result1]
         previous_score = None
         previous_text = text
-        
-        # Iteration 1: Full sentence
-        result1 = self.iteration1_full_sentence(text, previous_score)
-        results.append(result1)
-        
+
         if result1['decision'] == Decision.ACCEPT:
             return result1
         
@@ -383,7 +438,8 @@ class RecursiveEngine:
                 previous_score = result4['score']
         
         # Iteration 5: Final resolution (always run if we haven't accepted)
-        result5 = self.iteration5_final_resolution(text, previous_score)
+        # Reuses the matches computed upfront instead of re-scanning
+        result5 = self.iteration5_final_resolution(text, previous_score, matches=full_matches)
         results.append(result5)
         
         # Return best result
@@ -432,7 +488,18 @@ class RecursiveEngine:
         
         # Track which words have been processed
         processed = [False] * len(original_words)
-        output_parts = []
+        # Accumulate output as UTF-8 bytes and decode once at the end.
+        # Avoids the two-pass join over all parts for very long documents.
+        # Double space symbol between words preserves word boundaries for the decoder
+        # (single space symbol separates letters WITHIN a word).
+        word_separator = self.space_symbol + self.space_symbol
+        sep_bytes = word_separator.encode('utf-8')
+        output_buffer = bytearray()
+
+        def append_output(part):
+            output_buffer.extend(part.encode('utf-8'))
+            output_buffer.extend(sep_bytes)
+
         word_results = []
         total_confidence = 0.0
         matched_count = 0
@@ -474,7 +541,7 @@ class RecursiveEngine:
             
             if phrase_result.get('sanskrit') and phrase_result.get('score', 0.0) >= score_threshold:
                 # Good semantic phrase match - preserves SVO relationship
-                output_parts.append(phrase_result.get('sanskrit'))
+                append_output(phrase_result.get('sanskrit'))
                 word_results.append(phrase_result)
                 total_confidence += phrase_result.get('score', 0.0)
                 matched_count += len([w for w in phrase.split() if not is_stop_word(w)])
@@ -570,7 +637,7 @@ class RecursiveEngine:
             # Use best phrase match if found
             if best_match:
                 # Add Sanskrit token (replaces all meaningful words in the phrase)
-                output_parts.append(best_match['sanskrit'])
+                append_output(best_match['sanskrit'])
                 word_results.append(best_match['result'])
                 total_confidence += best_match['score']
                 matched_count += best_match['meaningful_count']
@@ -583,7 +650,7 @@ class RecursiveEngine:
                     
                     if is_stop_word(word):
                         # Add stop word to output (preserve in original position)
-                        output_parts.append(word)
+                        append_output(word)
                     
                     # Mark as processed
                     processed[word_idx] = True
@@ -594,7 +661,7 @@ class RecursiveEngine:
                 # No phrase match found - try single word matching
                 # But first, check if we should skip single word and preserve (for stop words)
                 if is_stop_word(word):
-                    output_parts.append(word)
+                    append_output(word)
                     processed[i] = True
                     i += 1
                     continue
@@ -608,14 +675,14 @@ class RecursiveEngine:
                 
                 if word_result.get('sanskrit') and word_result.get('score', 0.0) >= min_score:
                     # Acceptable single word match - use Sanskrit token
-                    output_parts.append(word_result.get('sanskrit'))
+                    append_output(word_result.get('sanskrit'))
                     word_results.append(word_result)
                     total_confidence += word_result.get('score', 0.0)
                     matched_count += 1
                 else:
                     # No good match - preserve original English word
                     # This preserves context better than letter-by-letter transliteration
-                    output_parts.append(word)
+                    append_output(word)
                 
                 processed[i] = True
                 i += 1
@@ -630,24 +697,21 @@ class RecursiveEngine:
                     word_result = self.process_chunk(clean_word(word))
                     # Lower threshold for safety check - accept if score > 0.25
                     if word_result.get('sanskrit') and word_result.get('score', 0.0) >= 0.25:
-                        output_parts.append(word_result.get('sanskrit'))
+                        append_output(word_result.get('sanskrit'))
                         word_results.append(word_result)
                         total_confidence += word_result.get('score', 0.0)
                         matched_count += 1
                     else:
                         # No match - preserve original English word
-                        output_parts.append(word)
+                        append_output(word)
                 else:
                     # Stop word - keep as is
-                    output_parts.append(word)
+                    append_output(word)
                 processed[idx] = True
         
-        # Build final output - use DOUBLE space symbol between words to preserve word boundaries
-        # Single space symbol is used between letters WITHIN a word
-        # Double space symbol is used BETWEEN words
-        # This allows decoder to detect word boundaries
-        word_separator = self.space_symbol + self.space_symbol  # Double space for word boundaries
-        sanskrit_output = word_separator.join(output_parts)
+        # Build final output - decode the byte accumulator once, dropping the
+        # trailing separator added by the last append
+        sanskrit_output = output_buffer[:-len(sep_bytes)].decode('utf-8') if output_buffer else ''
         
         # Calculate average confidence
         avg_confidence = total_confidence / matched_count if matched_count > 0 else 0.0
@@ -655,7 +719,6 @@ class RecursiveEngine:
         # Calculate token reduction
         # Count tokens by splitting on double space symbol (word separator)
         input_tokens = len(original_words)
-        word_separator = self.space_symbol + self.space_symbol
         if word_separator in sanskrit_output:
             output_tokens = len([t for t in sanskrit_output.split(word_separator) if t.strip()])
         else:
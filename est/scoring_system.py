@@ -5,19 +5,53 @@ Scoring System - Weighted scoring algorithm with SEMANTIC CONCEPT MATCHING
 Uses semantic expansion instead of raw word matching
 """
 
+import heapq
 import re
+import threading
 from typing import List, Dict, Tuple, Set
-from collections import Counter
+from collections import Counter, defaultdict
 from .semantic_expander import SemanticExpander
 from .context_detector import ContextDetector
 
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count('1')
+
+# Compiled once at import: extract_words would otherwise pay the regex-cache
+# hash lookup and rebuild the stop-word set literal on every call
+_WORD_RE = re.compile(r'\b[a-z]{2,}\b')
+
+# Serializes new concept-ID assignment in _to_bits: batch_tokenize runs on a
+# thread pool, and two threads reading len(_concept_id) for distinct novel
+# concepts could otherwise hand both concepts the same bit. Module-level so
+# the lock never ends up inside the pickled engine state
+_ID_LOCK = threading.Lock()
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+
+# Field order for the raw breakdown tuples emitted by the scoring kernel;
+# dicts are materialized only for the final top-k (see find_best_matches)
+_BREAKDOWN_KEYS = (
+    'semantic_frame', 'contextual_triggers', 'conceptual_anchors',
+    'frequency_index', 'english_definition', 'base_score',
+    'frame_prioritization', 'ambiguity_resolver', 'frequency_boost',
+    'context_priority', 'precision_boosts', 'neighbor_priority',
+    'context_alignment', 'frequency_context_match', 'resolver_validation',
+    'expected_token_boosts', 'total_small_boosts', 'total'
+)
+
 class ScoringSystem:
     def __init__(self, word_data: Dict):
         """Initialize with Sanskrit word data"""
         self.word_data = word_data
         self.expander = SemanticExpander()
         self.context_detector = ContextDetector()
-        
+
+        # Cache for extract_semantic_concepts results (major performance improvement:
+        # calculate_score expands the same chunk ~10 times per candidate otherwise)
+        self._concept_cache = {}
+
         # Scoring weights
         self.weights = {
             'semantic_frame': 0.40,
@@ -25,265 +59,433 @@ class ScoringSystem:
             'conceptual_anchors': 0.20,
             'frequency_index': 0.15
         }
-    
+
+        # Precompute per-word concept sets once - the compare_* methods would
+        # otherwise re-split and re-expand the same dictionary strings for
+        # every candidate on every calculate_score call
+        self._precompute_word_concepts()
+
+    def _precompute_word_concepts(self):
+        """
+        Build per-word concept tables from the static dictionary data.
+        Turns the per-candidate scoring work into single set intersections.
+        """
+        expand_word = self.expander.expand_word
+
+        self._frame_concepts = {}
+        self._frame_section_concepts = {}
+        self._trigger_concepts = {}
+        self._trigger_phrase_concepts = {}
+        self._anchor_concepts = {}
+        self._resolver_concepts = {}
+        self._def_concepts = {}
+        self._freq_index = {}
+        self._freq_map = {}
+        self._freq_max = {}
+        self._semantic_neighbors = {}
+
+        # Shared float objects for frequency weights: the dictionary reuses a
+        # small set of distinct weight values, so canonicalizing them avoids
+        # one 24-byte float object per (word, context) entry
+        weight_cache = {}
+
+        # Batch-expand every distinct phrase up front: frame sections,
+        # triggers, resolvers and definitions repeat heavily across rows,
+        # so one expand_texts call over the distinct strings replaces a
+        # per-row expand_text call for each of them
+        distinct_phrases = set()
+        for data in self.word_data.values():
+            semantic_frame = data.get('semantic_frame', '').strip()
+            if semantic_frame:
+                for section in semantic_frame.split('|'):
+                    section = section.strip()
+                    if section:
+                        distinct_phrases.add(section)
+            triggers = data.get('contextual_triggers', '').strip()
+            if triggers:
+                for trigger in triggers.split('|'):
+                    trigger = trigger.strip().lower()
+                    if trigger:
+                        distinct_phrases.add(trigger)
+            resolvers = data.get('ambiguity_resolvers', '').strip()
+            if resolvers:
+                for resolver in resolvers.split('|'):
+                    resolver = resolver.strip().lower()
+                    if resolver:
+                        distinct_phrases.add(resolver)
+            english_def = data.get('english', '').strip()
+            if english_def:
+                distinct_phrases.add(english_def)
+
+        phrase_list = list(distinct_phrases)
+        phrase_concepts = dict(zip(phrase_list, self.expander.expand_texts(phrase_list)))
+
+        for word, data in self.word_data.items():
+            # Semantic frame: whole-frame concepts plus per-section sets
+            # (sections are needed for role-specific prioritization)
+            semantic_frame = data.get('semantic_frame', '').strip()
+            frame_concepts = set()
+            section_concepts = []
+            if semantic_frame:
+                for section in semantic_frame.split('|'):
+                    section = section.strip()
+                    if section:
+                        concepts = frozenset(phrase_concepts[section])
+                        section_concepts.append(concepts)
+                        frame_concepts.update(concepts)
+            self._frame_concepts[word] = frozenset(frame_concepts)
+            self._frame_section_concepts[word] = section_concepts
+
+            # Contextual triggers: expand_word form (compare_triggers) and
+            # expand_text form (align_with_expected_context)
+            triggers = data.get('contextual_triggers', '').strip()
+            trigger_concepts = set()
+            trigger_phrase_concepts = set()
+            if triggers:
+                for trigger in triggers.split('|'):
+                    trigger = trigger.strip().lower()
+                    if trigger:
+                        trigger_concepts.update(expand_word(trigger))
+                        trigger_phrase_concepts.update(phrase_concepts[trigger])
+            self._trigger_concepts[word] = frozenset(trigger_concepts)
+            self._trigger_phrase_concepts[word] = frozenset(trigger_phrase_concepts)
+
+            # Conceptual anchors
+            anchors = data.get('conceptual_anchors', '').strip()
+            anchor_concepts = set()
+            if anchors:
+                for anchor in anchors.split('|'):
+                    anchor = anchor.strip().lower()
+                    if anchor:
+                        anchor_concepts.update(expand_word(anchor))
+            self._anchor_concepts[word] = frozenset(anchor_concepts)
+
+            # Ambiguity resolvers
+            resolvers = data.get('ambiguity_resolvers', '').strip()
+            resolver_concepts = set()
+            if resolvers:
+                for resolver in resolvers.split('|'):
+                    resolver = resolver.strip().lower()
+                    if resolver:
+                        resolver_concepts.update(phrase_concepts[resolver])
+            self._resolver_concepts[word] = frozenset(resolver_concepts)
+
+            # English definition concepts
+            english_def = data.get('english', '').strip()
+            self._def_concepts[word] = frozenset(phrase_concepts[english_def]) if english_def else frozenset()
+
+            # Usage frequency index parsed once into (context, weight) pairs
+            frequency_index = data.get('usage_frequency_index', '').strip()
+            freq_pairs = []
+            if frequency_index:
+                for part in frequency_index.split('|'):
+                    part = part.strip()
+                    if ':' in part:
+                        context, weight_str = part.rsplit(':', 1)
+                        weight_str = weight_str.strip()
+                        try:
+                            weight = weight_cache.setdefault(weight_str, float(weight_str))
+                        except ValueError:
+                            continue
+                        freq_pairs.append((context.strip().lower(), weight))
+            self._freq_index[word] = freq_pairs
+            # Dict form + precomputed max for O(1) exact-context lookups
+            self._freq_map[word] = dict(freq_pairs)
+            self._freq_max[word] = max((w for _, w in freq_pairs), default=0.0)
+
+            # Semantic neighbors (only present when the column was loaded)
+            neighbors = data.get('semantic_neighbors', '').strip()
+            self._semantic_neighbors[word] = frozenset(
+                n.strip() for n in neighbors.split('|') if n.strip()
+            ) if neighbors else frozenset()
+
+        # Dense integer IDs for the concept universe; each per-word concept
+        # set becomes an int bitset so overlap is a single C-level bigint AND
+        # plus a popcount instead of hashing every element
+        self._concept_id = {}
+        self._frame_bits = {}
+        self._frame_len = {}
+        self._frame_section_bits = {}
+        self._trigger_bits = {}
+        self._trigger_len = {}
+        self._trigger_phrase_bits = {}
+        self._trigger_phrase_len = {}
+        self._anchor_bits = {}
+        self._anchor_len = {}
+        self._resolver_bits = {}
+        self._resolver_len = {}
+        self._def_bits = {}
+        self._def_len = {}
+        self._bits_cache = {}
+
+        for word in self.word_data:
+            frame_concepts = self._frame_concepts[word]
+            self._frame_bits[word] = self._to_bits(frame_concepts)
+            self._frame_len[word] = len(frame_concepts)
+            self._frame_section_bits[word] = [
+                (self._to_bits(sc), len(sc)) for sc in self._frame_section_concepts[word] if sc
+            ]
+            trigger_concepts = self._trigger_concepts[word]
+            self._trigger_bits[word] = self._to_bits(trigger_concepts)
+            self._trigger_len[word] = len(trigger_concepts)
+            trigger_phrase_concepts = self._trigger_phrase_concepts[word]
+            self._trigger_phrase_bits[word] = self._to_bits(trigger_phrase_concepts)
+            self._trigger_phrase_len[word] = len(trigger_phrase_concepts)
+            anchor_concepts = self._anchor_concepts[word]
+            self._anchor_bits[word] = self._to_bits(anchor_concepts)
+            self._anchor_len[word] = len(anchor_concepts)
+            resolver_concepts = self._resolver_concepts[word]
+            self._resolver_bits[word] = self._to_bits(resolver_concepts)
+            self._resolver_len[word] = len(resolver_concepts)
+            def_concepts = self._def_concepts[word]
+            self._def_bits[word] = self._to_bits(def_concepts)
+            self._def_len[word] = len(def_concepts)
+
+        # Union bitset across the overlap-based tables: a single AND against
+        # it tells the scorers whether any overlap sub-score can be non-zero,
+        # letting them skip all of that math for disjoint candidates
+        self._union_bits = {}
+        for word in self.word_data:
+            self._union_bits[word] = (
+                self._frame_bits[word] | self._trigger_bits[word] |
+                self._anchor_bits[word] | self._resolver_bits[word] |
+                self._def_bits[word]
+            )
+
+        # Inverted concept -> words index for candidate retrieval:
+        # a word can only score above zero if it shares at least one concept
+        # with the chunk, so posting lists let find_best_matches skip the
+        # rest of the vocabulary entirely
+        concept_to_words = defaultdict(set)
+        for table in (self._frame_concepts, self._trigger_concepts,
+                      self._anchor_concepts, self._def_concepts):
+            for word, concepts in table.items():
+                for concept in concepts:
+                    concept_to_words[concept].add(word)
+        self._concept_to_words = dict(concept_to_words)
+
+        # Dictionary position of every word: candidates pulled from the
+        # posting lists are re-ordered by this before scoring so results do
+        # not depend on set iteration order (see find_best_matches)
+        self._word_index = {word: i for i, word in enumerate(self.word_data)}
+
     def extract_semantic_concepts(self, text: str) -> Set[str]:
         """
         Extract semantic concepts from text (not just words)
-        Returns: Set of semantic concepts
+        OPTIMIZED: Caches results per text - repeated chunks are expanded once
+        Returns: Set of semantic concepts (frozenset, immutable and shareable)
         """
+        # Check cache first
+        cached = self._concept_cache.get(text)
+        if cached is not None:
+            return cached
+
         # Use semantic expander to get all concepts
         expanded = self.expander.expand_with_context(text)
-        # Convert list back to set for set operations
+        # Convert list back to frozenset for set operations
         concepts_list = expanded['concepts']
-        return set(concepts_list) if isinstance(concepts_list, list) else concepts_list
+        concepts = frozenset(concepts_list)
+
+        # Cache the result (bounded to avoid unbounded growth on huge inputs)
+        if len(self._concept_cache) > 1024:
+            self._concept_cache.clear()
+        self._concept_cache[text] = concepts
+
+        return concepts
     
+    def _to_bits(self, concepts) -> int:
+        """Convert a concept collection to an int bitset over dense concept IDs"""
+        bits = 0
+        concept_id = self._concept_id
+        for concept in concepts:
+            cid = concept_id.get(concept)
+            if cid is None:
+                # Cold path (only concepts never seen before reach it), so
+                # taking the lock here costs nothing once the dictionary
+                # tables are built; re-check inside in case another thread
+                # assigned this concept between the get and the acquire
+                with _ID_LOCK:
+                    cid = concept_id.get(concept)
+                    if cid is None:
+                        cid = len(concept_id)
+                        concept_id[concept] = cid
+            bits |= 1 << cid
+        return bits
+
+    def concept_bits(self, text: str) -> int:
+        """
+        Bitset form of extract_semantic_concepts(text), cached per text.
+        Concepts unseen in the dictionary get fresh IDs so repeated chunks
+        still compare equal.
+        """
+        cached = self._bits_cache.get(text)
+        if cached is not None:
+            return cached
+
+        bits = self._to_bits(self.extract_semantic_concepts(text))
+
+        if len(self._bits_cache) > 1024:
+            self._bits_cache.clear()
+        self._bits_cache[text] = bits
+
+        return bits
+
     def extract_words(self, text: str) -> set:
         """Extract meaningful words from text (legacy method)"""
-        words = re.findall(r'\b[a-z]{2,}\b', text.lower())
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        return set(w for w in words if w not in stop_words)
+        return {w for w in _WORD_RE.findall(text.lower()) if w not in _STOP_WORDS}
     
-    def compare_frames(self, english_chunk: str, sanskrit_word: str) -> float:
+    def compare_frames(self, english_chunk: str, sanskrit_word: str,
+                       english_bits: int = None) -> float:
         """
         Compare semantic frames using SEMANTIC CONCEPTS (40% weight)
         Matches meanings, not just words
         """
-        word_data = self.word_data.get(sanskrit_word)
-        if not word_data:
-            return 0.0
-        
-        semantic_frame = word_data.get('semantic_frame', '').strip()
-        if not semantic_frame:
-            return 0.0
-        
-        # Get semantic concepts from English chunk
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Extract concepts from semantic frame sections
-        frame_concepts = set()
-        for section in semantic_frame.split('|'):
-            section = section.strip()
-            if section:
-                # Expand section to concepts
-                section_concepts = self.expander.expand_text(section)
-                frame_concepts.update(section_concepts)
-        
-        if not frame_concepts:
+        frame_bits = self._frame_bits.get(sanskrit_word)
+        if not frame_bits:
             return 0.0
-        
-        # Calculate semantic concept overlap
-        overlap = len(english_concepts & frame_concepts)
-        total_frame_concepts = len(frame_concepts)
-        
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        # Semantic concept overlap is one bigint AND plus a popcount
+        overlap = _popcount(english_bits & frame_bits)
+
         # Higher score for better concept overlap
-        return min(overlap / total_frame_concepts, 1.0) if total_frame_concepts > 0 else 0.0
+        return min(overlap / self._frame_len[sanskrit_word], 1.0)
     
-    def compare_triggers(self, english_chunk: str, sanskrit_word: str) -> float:
+    def compare_triggers(self, english_chunk: str, sanskrit_word: str,
+                         english_bits: int = None) -> float:
         """
         Compare contextual triggers using SEMANTIC CONCEPTS (25% weight)
         """
-        word_data = self.word_data.get(sanskrit_word)
-        if not word_data:
-            return 0.0
-        
-        triggers = word_data.get('contextual_triggers', '').strip()
-        if not triggers:
+        trigger_bits = self._trigger_bits.get(sanskrit_word)
+        if not trigger_bits:
             return 0.0
-        
-        # Get semantic concepts from English chunk
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Expand triggers to concepts
-        trigger_concepts = set()
-        for trigger in triggers.split('|'):
-            trigger = trigger.strip().lower()
-            if trigger:
-                # Expand trigger to concepts
-                trigger_expanded = self.expander.expand_word(trigger)
-                trigger_concepts.update(trigger_expanded)
-        
-        if not trigger_concepts:
-            return 0.0
-        
-        # Calculate concept overlap
-        overlap = len(english_concepts & trigger_concepts)
-        total_triggers = len(trigger_concepts)
-        
-        return min(overlap / total_triggers, 1.0) if total_triggers > 0 else 0.0
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        overlap = _popcount(english_bits & trigger_bits)
+
+        return min(overlap / self._trigger_len[sanskrit_word], 1.0)
     
-    def compare_anchors(self, english_chunk: str, sanskrit_word: str) -> float:
+    def compare_anchors(self, english_chunk: str, sanskrit_word: str,
+                        english_bits: int = None) -> float:
         """
         Compare conceptual anchors using SEMANTIC CONCEPTS (20% weight)
         """
-        word_data = self.word_data.get(sanskrit_word)
-        if not word_data:
-            return 0.0
-        
-        anchors = word_data.get('conceptual_anchors', '').strip()
-        if not anchors:
+        anchor_bits = self._anchor_bits.get(sanskrit_word)
+        if not anchor_bits:
             return 0.0
-        
-        # Get semantic concepts from English chunk
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Expand anchors to concepts
-        anchor_concepts = set()
-        for anchor in anchors.split('|'):
-            anchor = anchor.strip().lower()
-            if anchor:
-                # Expand anchor to concepts
-                anchor_expanded = self.expander.expand_word(anchor)
-                anchor_concepts.update(anchor_expanded)
-        
-        if not anchor_concepts:
-            return 0.0
-        
-        # Calculate concept overlap
-        overlap = len(english_concepts & anchor_concepts)
-        total_anchors = len(anchor_concepts)
-        
-        return min(overlap / total_anchors, 1.0) if total_anchors > 0 else 0.0
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        overlap = _popcount(english_bits & anchor_bits)
+
+        return min(overlap / self._anchor_len[sanskrit_word], 1.0)
     
-    def get_frequency_score(self, english_chunk: str, sanskrit_word: str) -> float:
+    def get_frequency_score(self, english_chunk: str, sanskrit_word: str,
+                            english_bits: int = None) -> float:
         """
         Get frequency index score using CONTEXT DETECTION (15% weight)
         """
-        word_data = self.word_data.get(sanskrit_word)
-        if not word_data:
+        freq_pairs = self._freq_index.get(sanskrit_word)
+        if not freq_pairs:
             return 0.0
-        
-        frequency_index = word_data.get('usage_frequency_index', '').strip()
-        if not frequency_index:
-            return 0.0
-        
+
         # Detect context from English chunk
         detected_context = self.context_detector.detect_context(english_chunk)
         primary_context = detected_context.get('primary_context')
-        
+
         if not primary_context:
             return 0.0
-        
-        # Get semantic concepts
-        english_concepts = self.extract_semantic_concepts(english_chunk)
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+        concept_id = self._concept_id
         total_weight = 0.0
-        
-        # Parse frequency index and check for context matches
-        for part in frequency_index.split('|'):
-            part = part.strip()
-            if ':' in part:
-                context, weight_str = part.rsplit(':', 1)
-                try:
-                    weight = float(weight_str)
-                    context_lower = context.strip().lower()
-                    
-                    # Check if detected context matches
-                    if context_lower == primary_context:
-                        total_weight += weight * 1.5  # Boost for exact context match
-                    # Also check if context word appears in concepts
-                    elif context_lower in english_concepts:
-                        total_weight += weight
-                except ValueError:
-                    continue
-        
+
+        # Check pre-parsed (context, weight) pairs for context matches
+        for context_lower, weight in freq_pairs:
+            # Check if detected context matches
+            if context_lower == primary_context:
+                total_weight += weight * 1.5  # Boost for exact context match
+            else:
+                # Also check if context word appears in chunk concepts
+                cid = concept_id.get(context_lower)
+                if cid is not None and (english_bits >> cid) & 1:
+                    total_weight += weight
+
         return min(total_weight, 1.0)
     
-    def compare_english_definition(self, english_chunk: str, sanskrit_candidate: str) -> float:
+    def compare_english_definition(self, english_chunk: str, sanskrit_candidate: str,
+                                   english_bits: int = None) -> float:
         """
         Compare against English definition using SEMANTIC CONCEPTS (bonus score)
         This is the most direct match - uses meaning, not words
         """
-        word_data = self.word_data.get(sanskrit_candidate)
-        if not word_data:
-            return 0.0
-        
-        english_def = word_data.get('english', '').strip()
-        if not english_def:
-            return 0.0
-        
-        # Get semantic concepts from both
-        chunk_concepts = self.extract_semantic_concepts(english_chunk)
-        def_concepts = self.extract_semantic_concepts(english_def)
-        
-        if not def_concepts:
+        def_bits = self._def_bits.get(sanskrit_candidate)
+        if not def_bits:
             return 0.0
-        
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
         # Calculate concept overlap (semantic similarity)
-        overlap = len(chunk_concepts & def_concepts)
-        total_def_concepts = len(def_concepts)
-        
+        overlap = _popcount(english_bits & def_bits)
+
         # Higher weight for definition match (most direct)
-        return min(overlap / total_def_concepts, 1.0) if total_def_concepts > 0 else 0.0
+        return min(overlap / self._def_len[sanskrit_candidate], 1.0)
     
-    def prioritize_by_semantic_frame(self, english_chunk: str, sanskrit_candidate: str) -> float:
+    def prioritize_by_semantic_frame(self, english_chunk: str, sanskrit_candidate: str,
+                                     english_bits: int = None) -> float:
         """
         Prioritize based on semantic frame role matching
         "divide property" should prefer aMSaH over aMS
         "share resources" should prefer aMS over aMSaH
         """
-        word_data = self.word_data.get(sanskrit_candidate, {})
-        semantic_frame = word_data.get('semantic_frame', '').strip()
-        
-        if not semantic_frame:
+        section_bits_list = self._frame_section_bits.get(sanskrit_candidate)
+        if not section_bits_list:
             return 0.0
-        
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Analyze semantic frame sections for role-specific matching
-        frame_sections = semantic_frame.split('|')
-        role_scores = []
-        
-        for section in frame_sections:
-            section = section.strip()
-            if section:
-                # Extract concepts from section
-                section_concepts = self.expander.expand_text(section)
-                
-                # Calculate role-specific overlap
-                overlap = len(english_concepts & section_concepts)
-                if len(section_concepts) > 0:
-                    role_score = overlap / len(section_concepts)
-                    role_scores.append(role_score)
-        
-        # Prioritize frames with higher role-specific matches
-        if role_scores:
-            # Use maximum role score (best matching role)
-            return max(role_scores)
-        
-        return 0.0
+
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        # Analyze precomputed frame sections for role-specific matching
+        best_role_score = 0.0
+        for section_bits, section_len in section_bits_list:
+            # Calculate role-specific overlap
+            role_score = _popcount(english_bits & section_bits) / section_len
+            if role_score > best_role_score:
+                best_role_score = role_score
+
+        # Prioritize frames with higher role-specific matches (best matching role)
+        return best_role_score
     
-    def use_ambiguity_resolvers(self, english_chunk: str, sanskrit_candidate: str) -> float:
+    def use_ambiguity_resolvers(self, english_chunk: str, sanskrit_candidate: str,
+                                english_bits: int = None) -> float:
         """
         Use Ambiguity_Resolvers for tie-breaking
         "property context" → boosts aMSaH
         "fairness principles" → boosts aMS
         """
-        word_data = self.word_data.get(sanskrit_candidate, {})
-        resolvers = word_data.get('ambiguity_resolvers', '').strip()
-        
-        if not resolvers:
+        resolver_bits = self._resolver_bits.get(sanskrit_candidate)
+        if not resolver_bits:
             return 0.0
-        
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Expand resolvers to concepts
-        resolver_concepts = set()
-        for resolver in resolvers.split('|'):
-            resolver = resolver.strip().lower()
-            if resolver:
-                resolver_expanded = self.expander.expand_text(resolver)
-                resolver_concepts.update(resolver_expanded)
-        
-        if not resolver_concepts:
-            return 0.0
-        
-        # Calculate resolver overlap
-        overlap = len(english_concepts & resolver_concepts)
-        total_resolvers = len(resolver_concepts)
-        
+
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        overlap = _popcount(english_bits & resolver_bits)
+
         # Resolver match is a strong signal (boost factor)
-        resolver_score = min(overlap / total_resolvers, 1.0) if total_resolvers > 0 else 0.0
-        
-        return resolver_score
+        return min(overlap / self._resolver_len[sanskrit_candidate], 1.0)
     
     def apply_frequency_boost(self, english_chunk: str, sanskrit_candidate: str) -> float:
         """
@@ -291,42 +493,23 @@ class ScoringSystem:
         Legal context → boost words with high legal frequency
         Returns: Boost factor (0.0 to 1.0)
         """
-        word_data = self.word_data.get(sanskrit_candidate, {})
-        frequency_index = word_data.get('usage_frequency_index', '').strip()
-        
-        if not frequency_index:
+        freq_map = self._freq_map.get(sanskrit_candidate)
+        if not freq_map:
             return 0.0
-        
+
         # Detect context from English chunk
         detected_context = self.context_detector.detect_context(english_chunk)
         primary_context = detected_context.get('primary_context')
-        
+
         if not primary_context:
             return 0.0
-        
-        # Find frequency weight for detected context
-        max_weight = 0.0
-        exact_match_weight = 0.0
-        
-        for part in frequency_index.split('|'):
-            part = part.strip()
-            if ':' in part:
-                context, weight_str = part.rsplit(':', 1)
-                try:
-                    weight = float(weight_str)
-                    context_lower = context.strip().lower()
-                    
-                    if context_lower == primary_context:
-                        # Exact context match
-                        exact_match_weight = weight
-                    elif weight > max_weight:
-                        max_weight = weight
-                except ValueError:
-                    continue
-        
-        # Return exact match weight if found, otherwise max weight
+
+        # Exact context weight if present, otherwise the precomputed max
         # Cap at 1.0 (100%)
-        return min(exact_match_weight if exact_match_weight > 0 else max_weight, 1.0)
+        exact_match_weight = freq_map.get(primary_context, 0.0)
+        if exact_match_weight > 0:
+            return min(exact_match_weight, 1.0)
+        return min(self._freq_max[sanskrit_candidate], 1.0)
     
     def apply_neighbor_priority(self, expected_tokens: List[str], sanskrit_candidate: str) -> float:
         """
@@ -336,68 +519,48 @@ class ScoringSystem:
         """
         if not expected_tokens:
             return 0.0
-        
-        candidate_data = self.word_data.get(sanskrit_candidate, {})
-        
+
         # Check if candidate is directly in expected tokens
         if sanskrit_candidate in expected_tokens:
             return 1.0  # Maximum boost for exact match
-        
+
         # Check if candidate appears in any expected token's Semantic_Neighbors
+        # (neighbor sets are pre-parsed at init)
         for expected_token in expected_tokens:
-            expected_data = self.word_data.get(expected_token, {})
-            neighbors = expected_data.get('semantic_neighbors', '').strip()
-            
-            if neighbors:
-                # Parse neighbors (format: "word1|word2|word3")
-                neighbor_list = [n.strip() for n in neighbors.split('|') if n.strip()]
-                if sanskrit_candidate in neighbor_list:
-                    # Found in neighbors - strong boost
-                    return 0.8
-        
+            if sanskrit_candidate in self._semantic_neighbors.get(expected_token, ()):
+                # Found in neighbors - strong boost
+                return 0.8
+
         return 0.0
     
-    def align_with_expected_context(self, english_chunk: str, sanskrit_candidate: str, expected_context: str = None) -> float:
+    def align_with_expected_context(self, english_chunk: str, sanskrit_candidate: str, expected_context: str = None,
+                                    english_bits: int = None) -> float:
         """
         Align with expected context by checking Contextual_Triggers
         "property inheritance" should boost tokens with "property" in Contextual_Triggers
         Returns: Boost factor (0.0 to 1.0)
         """
-        candidate_data = self.word_data.get(sanskrit_candidate, {})
-        triggers = candidate_data.get('contextual_triggers', '').strip()
-        
-        if not triggers:
+        trigger_bits = self._trigger_phrase_bits.get(sanskrit_candidate)
+        if not trigger_bits:
             return 0.0
-        
-        # Get semantic concepts from English chunk
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Expand triggers to concepts
-        trigger_concepts = set()
-        for trigger in triggers.split('|'):
-            trigger = trigger.strip().lower()
-            if trigger:
-                trigger_expanded = self.expander.expand_text(trigger)
-                trigger_concepts.update(trigger_expanded)
-        
-        if not trigger_concepts:
-            return 0.0
-        
-        # Calculate overlap between English concepts and trigger concepts
-        overlap = len(english_concepts & trigger_concepts)
-        total_triggers = len(trigger_concepts)
-        
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        overlap = _popcount(english_bits & trigger_bits)
+
         # Strong boost for high trigger alignment
-        alignment_score = min(overlap / total_triggers, 1.0) if total_triggers > 0 else 0.0
-        
+        alignment_score = min(overlap / self._trigger_phrase_len[sanskrit_candidate], 1.0)
+
         # Additional boost if expected_context matches
         if expected_context:
-            # Check if expected context appears in triggers
-            context_lower = expected_context.lower()
-            trigger_text = triggers.lower()
-            if context_lower in trigger_text:
+            # Check if expected context appears in the raw triggers string
+            candidate_data = self.word_data.get(sanskrit_candidate, {})
+            triggers = candidate_data.get('contextual_triggers', '')
+            if expected_context.lower() in triggers.lower():
                 alignment_score = min(alignment_score + 0.2, 1.0)
-        
+
         return alignment_score
     
     def match_frequency_context(self, expected_context: str, sanskrit_candidate: str) -> float:
@@ -408,71 +571,36 @@ class ScoringSystem:
         """
         if not expected_context:
             return 0.0
-        
-        candidate_data = self.word_data.get(sanskrit_candidate, {})
-        frequency_index = candidate_data.get('usage_frequency_index', '').strip()
-        
-        if not frequency_index:
+
+        freq_map = self._freq_map.get(sanskrit_candidate)
+        if not freq_map:
             return 0.0
-        
-        expected_context_lower = expected_context.lower()
-        max_weight = 0.0
-        exact_match_weight = 0.0
-        
-        # Parse frequency index
-        for part in frequency_index.split('|'):
-            part = part.strip()
-            if ':' in part:
-                context, weight_str = part.rsplit(':', 1)
-                try:
-                    weight = float(weight_str)
-                    context_lower = context.strip().lower()
-                    
-                    if context_lower == expected_context_lower:
-                        # Exact context match
-                        exact_match_weight = weight
-                    elif weight > max_weight:
-                        max_weight = weight
-                except ValueError:
-                    continue
-        
-        # Return exact match weight if found, otherwise max weight
-        return min(exact_match_weight if exact_match_weight > 0 else max_weight, 1.0)
+
+        # Exact context weight if present, otherwise the precomputed max
+        exact_match_weight = freq_map.get(expected_context.lower(), 0.0)
+        if exact_match_weight > 0:
+            return min(exact_match_weight, 1.0)
+        return min(self._freq_max[sanskrit_candidate], 1.0)
     
-    def validate_with_resolvers(self, english_chunk: str, sanskrit_candidate: str) -> float:
+    def validate_with_resolvers(self, english_chunk: str, sanskrit_candidate: str,
+                                english_bits: int = None) -> float:
         """
         Validate with Ambiguity_Resolvers - check if candidate's resolvers match input context
         "property context" resolver should match "property inheritance" input
         Returns: Boost factor (0.0 to 1.0)
         """
-        candidate_data = self.word_data.get(sanskrit_candidate, {})
-        resolvers = candidate_data.get('ambiguity_resolvers', '').strip()
-        
-        if not resolvers:
+        resolver_bits = self._resolver_bits.get(sanskrit_candidate)
+        if not resolver_bits:
             return 0.0
-        
-        # Get semantic concepts from English chunk
-        english_concepts = self.extract_semantic_concepts(english_chunk)
-        
-        # Expand resolvers to concepts
-        resolver_concepts = set()
-        for resolver in resolvers.split('|'):
-            resolver = resolver.strip().lower()
-            if resolver:
-                resolver_expanded = self.expander.expand_text(resolver)
-                resolver_concepts.update(resolver_expanded)
-        
-        if not resolver_concepts:
-            return 0.0
-        
-        # Calculate resolver overlap
-        overlap = len(english_concepts & resolver_concepts)
-        total_resolvers = len(resolver_concepts)
-        
+
+        # Get chunk concept bitset (precomputed by calculate_score)
+        if english_bits is None:
+            english_bits = self.concept_bits(english_chunk)
+
+        overlap = _popcount(english_bits & resolver_bits)
+
         # Resolver match is a very strong signal
-        resolver_match = min(overlap / total_resolvers, 1.0) if total_resolvers > 0 else 0.0
-        
-        return resolver_match
+        return min(overlap / self._resolver_len[sanskrit_candidate], 1.0)
     
     def calculate_score(self, english_chunk: str, sanskrit_candidate: str, 
                        expected_tokens: List[str] = None, expected_context: str = None) -> Tuple[float, Dict]:
@@ -482,16 +610,37 @@ class ScoringSystem:
         Returns: (total_score, score_breakdown)
         """
         word_data = self.word_data.get(sanskrit_candidate, {})
-        
-        semantic_frame_match = self.compare_frames(english_chunk, sanskrit_candidate)
-        contextual_triggers = self.compare_triggers(english_chunk, sanskrit_candidate)
-        conceptual_anchors = self.compare_anchors(english_chunk, sanskrit_candidate)
-        frequency_weight = self.get_frequency_score(english_chunk, sanskrit_candidate)
-        english_def_match = self.compare_english_definition(english_chunk, sanskrit_candidate)
-        
+
+        # Compute the chunk concept bitset ONCE and share across all sub-scores
+        # (each of these methods would otherwise re-expand the same chunk)
+        english_bits = self.concept_bits(english_chunk)
+
+        # Short-circuit: when the chunk shares no concept with any of the
+        # candidate's tables every overlap-based sub-score is zero, so the
+        # comparison calls can be skipped entirely (the common case for cold
+        # candidates); context and frequency signals are still evaluated
+        has_overlap = bool(english_bits & self._union_bits.get(sanskrit_candidate, 0))
+
+        if has_overlap:
+            semantic_frame_match = self.compare_frames(english_chunk, sanskrit_candidate, english_bits)
+            contextual_triggers = self.compare_triggers(english_chunk, sanskrit_candidate, english_bits)
+            conceptual_anchors = self.compare_anchors(english_chunk, sanskrit_candidate, english_bits)
+            english_def_match = self.compare_english_definition(english_chunk, sanskrit_candidate, english_bits)
+        else:
+            semantic_frame_match = 0.0
+            contextual_triggers = 0.0
+            conceptual_anchors = 0.0
+            english_def_match = 0.0
+
+        frequency_weight = self.get_frequency_score(english_chunk, sanskrit_candidate, english_bits)
+
         # NEW: Precision enhancements
-        frame_prioritization = self.prioritize_by_semantic_frame(english_chunk, sanskrit_candidate)
-        ambiguity_resolver_match = self.use_ambiguity_resolvers(english_chunk, sanskrit_candidate)
+        if has_overlap:
+            frame_prioritization = self.prioritize_by_semantic_frame(english_chunk, sanskrit_candidate, english_bits)
+            ambiguity_resolver_match = self.use_ambiguity_resolvers(english_chunk, sanskrit_candidate, english_bits)
+        else:
+            frame_prioritization = 0.0
+            ambiguity_resolver_match = 0.0
         frequency_boost = self.apply_frequency_boost(english_chunk, sanskrit_candidate)
         
         # Get context priority boost
@@ -507,10 +656,11 @@ class ScoringSystem:
             neighbor_priority = self.apply_neighbor_priority(expected_tokens, sanskrit_candidate)
         
         if expected_context:
-            context_alignment = self.align_with_expected_context(english_chunk, sanskrit_candidate, expected_context)
+            context_alignment = self.align_with_expected_context(english_chunk, sanskrit_candidate, expected_context, english_bits)
             frequency_context_match = self.match_frequency_context(expected_context, sanskrit_candidate)
         
-        resolver_validation = self.validate_with_resolvers(english_chunk, sanskrit_candidate)
+        if has_overlap:
+            resolver_validation = self.validate_with_resolvers(english_chunk, sanskrit_candidate, english_bits)
         
         # PROVEN ARCHITECTURE: Core 40/25/20/15 scoring (DO NOT CHANGE)
         # This is what gave us 97% confidence - preserve exactly
@@ -595,106 +745,262 @@ class ScoringSystem:
         }
         
         return total_score, score_breakdown
-    
-    def find_best_matches(self, english_chunk: str, top_n: int = 10, 
+
+    def _score_candidates(self, english_chunk: str, candidates,
+                          expected_tokens: List[str] = None,
+                          expected_context: str = None,
+                          with_breakdown: bool = True) -> List[Tuple[str, float, tuple]]:
+        """
+        Fused scoring kernel for find_best_matches
+        OPTIMIZED: scores a whole candidate list in one tight loop with the
+        bitset tables bound to locals and the sub-score math inlined, instead
+        of ~10 method calls per candidate through calculate_score. Chunk-level
+        inputs (concept bitset, detected context) are computed once per call.
+        Produces the same scores as calculate_score; breakdowns are emitted
+        as raw value tuples in _BREAKDOWN_KEYS order, or as None when
+        with_breakdown is False (the bulk-scoring path, where only the
+        final top-k ever needs one).
+        """
+        english_bits = self.concept_bits(english_chunk)
+
+        # Chunk-level context detection (depends only on the chunk)
+        detected_context = self.context_detector.detect_context(english_chunk)
+        primary_context = detected_context.get('primary_context')
+        get_context_priority = self.context_detector.get_context_priority
+
+        # Bind tables and weights to locals for the hot loop
+        word_data = self.word_data
+        frame_bits = self._frame_bits
+        frame_len = self._frame_len
+        frame_section_bits = self._frame_section_bits
+        trigger_bits = self._trigger_bits
+        trigger_len = self._trigger_len
+        trigger_phrase_bits = self._trigger_phrase_bits
+        trigger_phrase_len = self._trigger_phrase_len
+        anchor_bits = self._anchor_bits
+        anchor_len = self._anchor_len
+        resolver_bits = self._resolver_bits
+        resolver_len = self._resolver_len
+        def_bits = self._def_bits
+        def_len = self._def_len
+        freq_index = self._freq_index
+        freq_map = self._freq_map
+        freq_max = self._freq_max
+        semantic_neighbors = self._semantic_neighbors
+        concept_id = self._concept_id
+        popcount = _popcount
+
+        w_frame = self.weights['semantic_frame']
+        w_trigger = self.weights['contextual_triggers']
+        w_anchor = self.weights['conceptual_anchors']
+        w_freq = self.weights['frequency_index']
+
+        expected_context_lower = expected_context.lower() if expected_context else None
+
+        # Hoist expected-token membership structures out of the hot loop:
+        # per candidate this becomes two O(1) lookups instead of a list scan
+        # plus a loop over every expected token's neighbor set
+        if expected_tokens:
+            expected_set = frozenset(expected_tokens)
+            expected_neighbor_union = set()
+            for token in expected_tokens:
+                expected_neighbor_union |= semantic_neighbors.get(token, frozenset())
+        else:
+            expected_set = expected_neighbor_union = frozenset()
+
+        results = []
+        for candidate in candidates:
+            data = word_data.get(candidate, {})
+
+            # Core 40/25/20/15 signals: one bigint AND + popcount each
+            bits = frame_bits.get(candidate, 0)
+            semantic_frame_match = min(popcount(english_bits & bits) / frame_len[candidate], 1.0) if bits else 0.0
+            bits = trigger_bits.get(candidate, 0)
+            contextual_triggers = min(popcount(english_bits & bits) / trigger_len[candidate], 1.0) if bits else 0.0
+            bits = anchor_bits.get(candidate, 0)
+            conceptual_anchors = min(popcount(english_bits & bits) / anchor_len[candidate], 1.0) if bits else 0.0
+            bits = def_bits.get(candidate, 0)
+            english_def_match = min(popcount(english_bits & bits) / def_len[candidate], 1.0) if bits else 0.0
+
+            # Frequency index: weight for the detected context plus concept hits
+            freq_pairs = freq_index.get(candidate)
+            frequency_weight = 0.0
+            frequency_boost = 0.0
+            if freq_pairs and primary_context:
+                total_weight = 0.0
+                for context_lower, weight in freq_pairs:
+                    if context_lower == primary_context:
+                        total_weight += weight * 1.5
+                    else:
+                        cid = concept_id.get(context_lower)
+                        if cid is not None and (english_bits >> cid) & 1:
+                            total_weight += weight
+                frequency_weight = min(total_weight, 1.0)
+                exact_match_weight = freq_map[candidate].get(primary_context, 0.0)
+                frequency_boost = min(exact_match_weight if exact_match_weight > 0 else freq_max[candidate], 1.0)
+
+            # Role-specific frame prioritization (best matching section)
+            frame_prioritization = 0.0
+            for section_bits, section_len in frame_section_bits.get(candidate, ()):
+                role_score = popcount(english_bits & section_bits) / section_len
+                if role_score > frame_prioritization:
+                    frame_prioritization = role_score
+
+            # Ambiguity resolvers (used for both tie-break and validation)
+            bits = resolver_bits.get(candidate, 0)
+            resolver_overlap = min(popcount(english_bits & bits) / resolver_len[candidate], 1.0) if bits else 0.0
+            ambiguity_resolver_match = resolver_overlap
+            resolver_validation = resolver_overlap
+
+            context_priority = get_context_priority(english_chunk, candidate, data)
+
+            # Expected token priority boosts
+            neighbor_priority = 0.0
+            context_alignment = 0.0
+            frequency_context_match = 0.0
+
+            if expected_tokens:
+                if candidate in expected_set:
+                    neighbor_priority = 1.0
+                elif candidate in expected_neighbor_union:
+                    neighbor_priority = 0.8
+
+            if expected_context:
+                bits = trigger_phrase_bits.get(candidate, 0)
+                if bits:
+                    context_alignment = min(popcount(english_bits & bits) / trigger_phrase_len[candidate], 1.0)
+                    if expected_context_lower in data.get('contextual_triggers', '').lower():
+                        context_alignment = min(context_alignment + 0.2, 1.0)
+                if freq_pairs:
+                    exact_match_weight = freq_map[candidate].get(expected_context_lower, 0.0)
+                    frequency_context_match = min(exact_match_weight if exact_match_weight > 0 else freq_max[candidate], 1.0)
+
+            # PROVEN ARCHITECTURE: Core 40/25/20/15 scoring (DO NOT CHANGE)
+            base_score = (
+                semantic_frame_match * w_frame +
+                contextual_triggers * w_trigger +
+                conceptual_anchors * w_anchor +
+                frequency_weight * w_freq +
+                english_def_match * 0.20
+            )
+
+            # Small additive tie-breaker boosts (same thresholds as calculate_score)
+            precision_boosts = 0.0
+            if frame_prioritization > 0.70:
+                precision_boosts += frame_prioritization * 0.05
+            if ambiguity_resolver_match > 0.60:
+                precision_boosts += ambiguity_resolver_match * 0.05
+            if frequency_boost > 0.50:
+                precision_boosts += frequency_boost * 0.03
+            if context_priority > 0.50:
+                precision_boosts += context_priority * 0.02
+
+            expected_token_boosts = 0.0
+            if expected_tokens or expected_context:
+                if neighbor_priority >= 1.0:
+                    expected_token_boosts += 0.10
+                elif neighbor_priority >= 0.80:
+                    expected_token_boosts += 0.05
+                if context_alignment > 0.70:
+                    expected_token_boosts += context_alignment * 0.05
+                if frequency_context_match > 0.50:
+                    expected_token_boosts += frequency_context_match * 0.03
+
+            total_small_boosts = min(precision_boosts + expected_token_boosts, 0.20)
+            total_score = min(base_score + total_small_boosts, 1.0)
+
+            if total_score <= 0:
+                continue
+
+            if not with_breakdown:
+                results.append((candidate, total_score, None))
+                continue
+
+            # Raw value tuple in _BREAKDOWN_KEYS order - building an 18-key
+            # dict per scored candidate is the biggest loop allocation
+            results.append((candidate, total_score, (
+                semantic_frame_match, contextual_triggers, conceptual_anchors,
+                frequency_weight, english_def_match, base_score,
+                frame_prioritization, ambiguity_resolver_match, frequency_boost,
+                context_priority, precision_boosts, neighbor_priority,
+                context_alignment, frequency_context_match, resolver_validation,
+                expected_token_boosts, total_small_boosts, total_score
+            )))
+
+        return results
+
+    def find_best_matches(self, english_chunk: str, top_n: int = 10,
                          expected_tokens: List[str] = None, expected_context: str = None) -> List[Tuple[str, float, Dict]]:
         """
         Find best matching Sanskrit words using SEMANTIC CONCEPT MATCHING
         Applies context-aware filtering and expected token priority boosts
-        OPTIMIZED: Aggressive early exit and maximum iteration limit
+        OPTIMIZED: Retrieves candidates through the inverted concept index
+        instead of scanning a truncated slice of the vocabulary
         """
         matches = []
-        
-        # Ultra-aggressive early exit for performance
-        early_exit_threshold = 0.25  # Lowered from 0.3 to 0.25
-        early_exit_count = top_n  # Need top_n high-score matches
-        max_iterations = 500  # Limit to first 500 words (reduced from 1000)
-        min_matches_for_early_exit = top_n  # Need at least top_n matches
-        max_total_matches = top_n * 3  # Stop after collecting 3x top_n matches (reduced from 5x)
-        quick_exit_iterations = 100  # If no good matches after 100 iterations, likely no match (reduced from 200)
-        
+
         # Check expected tokens first (priority boost)
         if expected_tokens:
-            for token in expected_tokens:
-                if token in self.word_data:
-                    score, breakdown = self.calculate_score(
-                        english_chunk, 
-                        token,
-                        expected_tokens=expected_tokens,
-                        expected_context=expected_context
-                    )
-                    if score > 0:
-                        matches.append((token, score * 1.1, breakdown))  # 10% boost for expected
-        
-        # Search through words with aggressive early exit and iteration limit
-        high_score_count = 0
-        iteration = 0
-        best_score_so_far = 0.0
-        word_list = list(self.word_data.keys())
-        
-        for sanskrit_word in word_list:
-            iteration += 1
-            
-            # Quick exit: if we've checked many words and best score is still very low, likely no match
-            if iteration > quick_exit_iterations and best_score_so_far < 0.1 and len(matches) == 0:
-                # No good matches found after checking many words, likely no match exists
-                break
-            
-            # Maximum iteration limit - stop after checking max_iterations words
-            if iteration > max_iterations:
-                break
-            
-            # Skip if already in matches (from expected_tokens)
-            if any(m[0] == sanskrit_word for m in matches):
-                continue
-            
-            score, breakdown = self.calculate_score(
-                english_chunk, 
-                sanskrit_word,
-                expected_tokens=expected_tokens,
-                expected_context=expected_context
-            )
-            if score > 0:
-                matches.append((sanskrit_word, score, breakdown))
-                best_score_so_far = max(best_score_so_far, score)
-                
-                # Early exit: if we have enough high-score matches, stop searching
-                if score >= early_exit_threshold:
-                    high_score_count += 1
-                    # More aggressive: stop if we have top_n high-score matches
-                    if high_score_count >= early_exit_count and len(matches) >= min_matches_for_early_exit:
-                        # We have enough good matches, sort and return
-                        matches.sort(key=lambda x: x[1], reverse=True)
-                        matches = self.context_detector.context_aware_filter(english_chunk, matches, self.word_data)
-                        return matches[:top_n]
-                
-                # Also exit early if we have enough matches total (even if scores are lower)
-                if len(matches) >= max_total_matches:
-                    # We have enough matches, sort and return best ones
-                    matches.sort(key=lambda x: x[1], reverse=True)
-                    matches = self.context_detector.context_aware_filter(english_chunk, matches, self.word_data)
-                    return matches[:top_n]
-                
-                # Early exit if we have top_n matches and best score is decent
-                if len(matches) >= top_n:
-                    matches.sort(key=lambda x: x[1], reverse=True)
-                    if matches[0][1] >= 0.15:  # Best match is at least 15% (lowered from 20%)
-                        matches = self.context_detector.context_aware_filter(english_chunk, matches, self.word_data)
-                        return matches[:top_n]
-                
-                # Very early exit: if we have a few good matches, return early
-                if len(matches) >= 3 and best_score_so_far >= 0.4:
-                    matches.sort(key=lambda x: x[1], reverse=True)
-                    matches = self.context_detector.context_aware_filter(english_chunk, matches, self.word_data)
-                    return matches[:top_n]
-        
-        # Sort by score descending
+            known_tokens = [t for t in expected_tokens if t in self.word_data]
+            for token, score, breakdown in self._score_candidates(
+                    english_chunk, known_tokens, expected_tokens, expected_context):
+                matches.append((token, score * 1.1, breakdown))  # 10% boost for expected
+
+        seen = {m[0] for m in matches}
+
+        # Collect candidates from posting lists: only words sharing at least
+        # one concept with the chunk can score above zero, so the rest of
+        # the vocabulary is skipped with full recall (no 500-word cap)
+        english_concepts = self.extract_semantic_concepts(english_chunk)
+        concept_to_words = self._concept_to_words
+        candidates = set()
+        for concept in english_concepts:
+            words = concept_to_words.get(concept)
+            if words:
+                candidates.update(words)
+        candidates -= seen  # already scored via expected_tokens
+
+        # Score candidates in dictionary insertion order: the sorts below are
+        # stable and break score ties by position, so iterating the raw set
+        # here would let PYTHONHASHSEED decide tie winners. Sorting by the
+        # precomputed word index restores the fixed dictionary-scan order
+        ordered = sorted(candidates, key=self._word_index.__getitem__)
+
+        # Score the whole candidate set in one fused pass; breakdowns are
+        # skipped here and rebuilt below for the few returned matches
+        matches.extend(self._score_candidates(
+            english_chunk, ordered, expected_tokens, expected_context,
+            with_breakdown=False))
+
+        # Bounded top-k selection instead of sorting every scored candidate:
+        # context_aware_filter rescales scores by (0.7 + priority * 0.3), so
+        # nothing below 0.7x the current top_n-th score can reach the top_n
+        # after re-ranking - prune those before the sort
+        if len(matches) > top_n:
+            kth_score = heapq.nlargest(top_n, (score for _, score, _ in matches))[-1]
+            threshold = 0.7 * kth_score
+            matches = [m for m in matches if m[1] >= threshold]
+
+        # Sort surviving candidates by score descending
         matches.sort(key=lambda x: x[1], reverse=True)
         
         # Apply context-aware filtering and re-ranking
         matches = self.context_detector.context_aware_filter(english_chunk, matches, self.word_data)
-        
-        return matches[:top_n]
+
+        # Materialize breakdown dicts only for the returned top-k; bulk-path
+        # entries carry no values and are re-scored once for the breakdown
+        results = []
+        for word, score, values in matches[:top_n]:
+            if values is None:
+                _, breakdown = self.calculate_score(
+                    english_chunk, word,
+                    expected_tokens=expected_tokens,
+                    expected_context=expected_context
+                )
+            else:
+                breakdown = dict(zip(_BREAKDOWN_KEYS, values))
+            results.append((word, score, breakdown))
+        return results
 
 def main():
     """Test scoring system"""
@@ -5,13 +5,45 @@ Breaks and rearranges sentences to preserve context through semantic roles
 """
 
 import re
+from collections import namedtuple
 from typing import List, Dict, Tuple, Optional
 
-class SemanticChunker:
-    def __init__(self):
-        """Initialize semantic chunker"""
-        # Common verbs
-        self.verbs = {
+# Lightweight record for semantic units - a namedtuple is cheaper to build
+# and smaller than a four-key dict, and fields are C-level slot fetches
+SemanticUnit = namedtuple('SemanticUnit', ['type', 'text', 'words', 'original_indices'])
+
+class SVOChunk:
+    """
+    Compact chunk record emitted by extract_svo_chunks - __slots__ avoids a
+    per-chunk dict and makes field reads direct slot fetches
+    """
+    __slots__ = ('type', 'subject', 'verb', 'object', 'subject_words',
+                 'object_words', 'words', 'start_idx', 'end_idx',
+                 'subj_start', 'verb_idx', 'obj_start', 'obj_end')
+
+    def __init__(self, type, words, start_idx, end_idx, subject=None,
+                 verb=None, obj=None, subject_words=None, object_words=None,
+                 subj_start=0, verb_idx=0, obj_start=0, obj_end=0):
+        self.type = type
+        self.words = words
+        self.start_idx = start_idx
+        self.end_idx = end_idx
+        self.subject = subject
+        self.verb = verb
+        self.object = obj
+        self.subject_words = subject_words if subject_words is not None else []
+        self.object_words = object_words if object_words is not None else []
+        self.subj_start = subj_start
+        self.verb_idx = verb_idx
+        self.obj_start = obj_start
+        self.obj_end = obj_end
+
+# Built once at import - is_verb runs inside tight scan loops and would
+# otherwise strip punctuation with fresh-string allocations per token
+_PUNCT_TBL = str.maketrans('', '', '.,!?;:()[]{}')
+
+# Common verbs
+_VERBS = frozenset({
             'is', 'are', 'was', 'were', 'be', 'been', 'being',
             'have', 'has', 'had', 'having',
             'do', 'does', 'did', 'doing',
@@ -70,7 +102,15 @@ class SemanticChunker:
             'increase', 'increases', 'increased', 'increasing',
             'expect', 'expects', 'expected', 'expecting',
             'expand', 'expands', 'expanded', 'expanding'
-        }
+})
+
+class SemanticChunker:
+    def __init__(self):
+        """Initialize semantic chunker"""
+        # Kept as an attribute for compatibility; the set itself is the
+        # module-level frozenset
+        self.verbs = _VERBS
+
         
         # Subject indicators (words that often indicate subjects)
         self.subject_indicators = {
@@ -85,8 +125,7 @@ class SemanticChunker:
     
     def is_verb(self, word: str) -> bool:
         """Check if word is a verb"""
-        word_lower = word.lower().strip('.,!?;:()[]{}')
-        return word_lower in self.verbs
+        return word.translate(_PUNCT_TBL).lower() in _VERBS
     
     def extract_svo_chunks(self, text: str) -> List[Dict]:
         """
@@ -96,29 +135,28 @@ class SemanticChunker:
         words = text.split()
         chunks = []
         i = 0
-        
-        while i < len(words):
+        n = len(words)
+
+        # Test each token once up front - the overlapping scan windows below
+        # would otherwise re-check the same word many times
+        verb_mask = list(map(self.is_verb, words))
+
+        while i < n:
             # Look for verb
             verb_idx = None
             verb = None
-            
+
             # Find next verb
-            for j in range(i, min(i + 10, len(words))):
-                if self.is_verb(words[j]):
+            for j in range(i, min(i + 10, n)):
+                if verb_mask[j]:
                     verb_idx = j
                     verb = words[j]
                     break
             
             if verb_idx is None:
                 # No verb found, treat remaining as object/noun phrase
-                if i < len(words):
-                    chunk = {
-                        'type': 'noun_phrase',
-                        'words': words[i:],
-                        'start_idx': i,
-                        'end_idx': len(words)
-                    }
-                    chunks.append(chunk)
+                if i < n:
+                    chunks.append(SVOChunk('noun_phrase', words[i:], i, n))
                 break
             
             # Extract subject (words before verb)
@@ -132,25 +170,31 @@ class SemanticChunker:
             # Extract object (words after verb, up to next verb or end)
             object_start = verb_end
             object_end = verb_end
-            for j in range(verb_end, min(verb_end + 8, len(words))):
-                if self.is_verb(words[j]):
+            for j in range(verb_end, min(verb_end + 8, n)):
+                if verb_mask[j]:
                     break
                 object_end = j + 1
             
             object_words = words[object_start:object_end] if object_end > object_start else []
             obj = ' '.join(object_words) if object_words else None
             
-            # Create SVO chunk
-            chunk = {
-                'type': 'svo',
-                'subject': subject,
-                'verb': verb,
-                'object': obj,
-                'words': words[i:object_end] if object_end > i else words[i:verb_end],
-                'start_idx': i,
-                'end_idx': object_end if object_end > verb_end else verb_end
-            }
-            chunks.append(chunk)
+            # Create SVO chunk, keeping the already-split word lists and
+            # integer spans so downstream stages never re-tokenize
+            chunks.append(SVOChunk(
+                'svo',
+                words[i:object_end] if object_end > i else words[i:verb_end],
+                i,
+                object_end if object_end > verb_end else verb_end,
+                subject=subject,
+                verb=verb,
+                obj=obj,
+                subject_words=subject_words,
+                object_words=object_words,
+                subj_start=i,
+                verb_idx=verb_idx,
+                obj_start=object_start,
+                obj_end=object_end
+            ))
             
             i = object_end if object_end > verb_end else verb_end
         
@@ -167,39 +211,35 @@ class SemanticChunker:
         semantic_units = []
         
         for chunk in svo_chunks:
-            if chunk['type'] == 'svo':
-                # Create semantic units for subject, verb, object
-                if chunk['subject']:
-                    semantic_units.append({
-                        'type': 'subject',
-                        'text': chunk['subject'],
-                        'words': chunk['subject'].split(),
-                        'original_indices': list(range(chunk['start_idx'], chunk['start_idx'] + len(chunk['subject'].split())))
-                    })
-                
-                if chunk['verb']:
-                    semantic_units.append({
-                        'type': 'verb',
-                        'text': chunk['verb'],
-                        'words': [chunk['verb']],
-                        'original_indices': [chunk['start_idx'] + (len(chunk['subject'].split()) if chunk['subject'] else 0)]
-                    })
-                
-                if chunk['object']:
-                    semantic_units.append({
-                        'type': 'object',
-                        'text': chunk['object'],
-                        'words': chunk['object'].split(),
-                        'original_indices': list(range(chunk['start_idx'] + (len(chunk['subject'].split()) if chunk['subject'] else 0) + 1, chunk['end_idx']))
-                    })
+            if chunk.type == 'svo':
+                # Create semantic units for subject, verb, object from the
+                # integer spans recorded by extract_svo_chunks; indices stay
+                # lazy range objects instead of materialized lists
+                verb_idx = chunk.verb_idx
+
+                if chunk.subject:
+                    semantic_units.append(SemanticUnit(
+                        'subject', chunk.subject, chunk.subject_words,
+                        range(chunk.subj_start, verb_idx)
+                    ))
+
+                if chunk.verb:
+                    semantic_units.append(SemanticUnit(
+                        'verb', chunk.verb, [chunk.verb],
+                        [verb_idx]
+                    ))
+
+                if chunk.object:
+                    semantic_units.append(SemanticUnit(
+                        'object', chunk.object, chunk.object_words,
+                        range(chunk.obj_start, chunk.obj_end)
+                    ))
             else:
                 # Noun phrase
-                semantic_units.append({
-                    'type': 'noun_phrase',
-                    'text': ' '.join(chunk['words']),
-                    'words': chunk['words'],
-                    'original_indices': list(range(chunk['start_idx'], chunk['end_idx']))
-                })
+                semantic_units.append(SemanticUnit(
+                    'noun_phrase', ' '.join(chunk.words), chunk.words,
+                    range(chunk.start_idx, chunk.end_idx)
+                ))
         
         return semantic_units
     
@@ -210,48 +250,35 @@ class SemanticChunker:
         """
         units = self.group_semantic_units(text)
         phrases = []
-        
+
+        # Single linear scan over a precomputed type array: the pattern tests
+        # become tuple comparisons instead of three sequential if-blocks that
+        # each re-read the unit types
+        types = [u.type for u in units]
         i = 0
-        while i < len(units):
-            # Try to group subject-verb-object together
-            if i < len(units) - 2:
-                subject_unit = units[i] if units[i]['type'] == 'subject' else None
-                verb_unit = units[i + 1] if i + 1 < len(units) and units[i + 1]['type'] == 'verb' else None
-                object_unit = units[i + 2] if i + 2 < len(units) and units[i + 2]['type'] == 'object' else None
-                
-                if subject_unit and verb_unit and object_unit:
-                    # Create SVO phrase
-                    svo_phrase = f"{subject_unit['text']} {verb_unit['text']} {object_unit['text']}"
-                    phrases.append(svo_phrase)
+        n = len(units)
+        while i < n:
+            t0 = types[i]
+            t1 = types[i + 1] if i + 1 < n else None
+
+            if t0 == 'subject' and t1 == 'verb':
+                if i + 2 < n and types[i + 2] == 'object':
+                    # Subject-verb-object phrase
+                    phrases.append(f"{units[i].text} {units[i + 1].text} {units[i + 2].text}")
                     i += 3
-                    continue
-            
-            # Try subject-verb
-            if i < len(units) - 1:
-                subject_unit = units[i] if units[i]['type'] == 'subject' else None
-                verb_unit = units[i + 1] if units[i + 1]['type'] == 'verb' else None
-                
-                if subject_unit and verb_unit:
-                    sv_phrase = f"{subject_unit['text']} {verb_unit['text']}"
-                    phrases.append(sv_phrase)
-                    i += 2
-                    continue
-            
-            # Try verb-object
-            if i < len(units) - 1:
-                verb_unit = units[i] if units[i]['type'] == 'verb' else None
-                object_unit = units[i + 1] if units[i + 1]['type'] == 'object' else None
-                
-                if verb_unit and object_unit:
-                    vo_phrase = f"{verb_unit['text']} {object_unit['text']}"
-                    phrases.append(vo_phrase)
+                else:
+                    # Subject-verb phrase
+                    phrases.append(f"{units[i].text} {units[i + 1].text}")
                     i += 2
-                    continue
-            
-            # Single unit
-            phrases.append(units[i]['text'])
-            i += 1
-        
+            elif t0 == 'verb' and t1 == 'object':
+                # Verb-object phrase
+                phrases.append(f"{units[i].text} {units[i + 1].text}")
+                i += 2
+            else:
+                # Single unit
+                phrases.append(units[i].text)
+                i += 1
+
         return phrases
 
 def main():
@@ -271,12 +298,12 @@ def main():
         chunks = chunker.extract_svo_chunks(text)
         print("SVO Chunks:")
         for chunk in chunks:
-            if chunk['type'] == 'svo':
-                print(f"  Subject: {chunk.get('subject', 'None')}")
-                print(f"  Verb: {chunk.get('verb', 'None')}")
-                print(f"  Object: {chunk.get('object', 'None')}")
+            if chunk.type == 'svo':
+                print(f"  Subject: {chunk.subject}")
+                print(f"  Verb: {chunk.verb}")
+                print(f"  Object: {chunk.object}")
             else:
-                print(f"  Noun phrase: {chunk.get('words', [])}")
+                print(f"  Noun phrase: {chunk.words}")
         print()
         
         phrases = chunker.create_semantic_phrases(text)
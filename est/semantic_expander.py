@@ -5,194 +5,293 @@ Uses synonym dictionaries, WordNet-like relationships, and contextual meanings
 """
 
 from typing import List, Set, Dict
+import functools
 import re
+import sys
+
+# Compiled/built once at import - expand_text would otherwise rebuild the
+# stop-word set and pay a regex-cache lookup on every call
+_WORD_RE = re.compile(r'\b[a-z]{2,}\b')
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+                         'of', 'with', 'by', 'from', 'as', 'is', 'are', 'was', 'were'})
+
+# Comprehensive semantic concept mappings, shared by every expander
+# instance - each word maps to its semantic concepts (synonyms, related
+# meanings); tuple values are immutable and slightly smaller than lists
+_SEMANTIC_CONCEPTS = {
+    'divide': ('split', 'share', 'distribute', 'portion', 'division', 'allocation', 
+              'separate', 'partition', 'apportion', 'allocate', 'parcel', 'section'),
+    'share': ('divide', 'distribute', 'portion', 'part', 'allot', 'allocate', 
+             'apportion', 'parcel', 'division', 'split'),
+    'distribute': ('divide', 'share', 'allocate', 'apportion', 'dispense', 
+                  'allot', 'parcel', 'portion', 'divide up'),
+    'portion': ('part', 'share', 'division', 'segment', 'piece', 'fraction', 
+               'allocation', 'allotment', 'quota'),
+    'part': ('portion', 'share', 'division', 'segment', 'piece', 'fraction', 
+            'component', 'section'),
+    'property': ('possession', 'asset', 'ownership', 'estate', 'belonging', 
+                'real estate', 'land', 'holding'),
+    'inheritance': ('heritage', 'legacy', 'estate', 'bequest', 'patrimony', 
+                  'endowment', 'succession'),
+    'fraction': ('portion', 'part', 'division', 'segment', 'piece', 
+                'numerator', 'denominator'),
+    'calculate': ('compute', 'determine', 'figure', 'reckon', 'work out', 
+                 'estimate', 'assess'),
+    'mathematical': ('numeric', 'arithmetic', 'computational', 'quantitative', 
+                    'numerical'),
+    'free': ('liberate', 'release', 'unbound', 'unrestricted', 'unfettered'),
+    'obligation': ('debt', 'duty', 'responsibility', 'commitment', 'liability'),
+    'debt': ('obligation', 'liability', 'indebtedness', 'arrears'),
+    'resources': ('assets', 'materials', 'supplies', 'means', 'funds', 'wealth'),
+    'assets': ('resources', 'property', 'possessions', 'wealth', 'holdings'),
+    'fairly': ('equitably', 'justly', 'evenly', 'equally', 'impartially'),
+    'cake': ('food', 'dessert', 'sweet', 'pastry'),
+    'portions': ('parts', 'shares', 'divisions', 'segments', 'pieces'),
+    'how': ('method', 'way', 'manner', 'process', 'technique'),
+    # Bare stop words ('to', 'a', 'for') live in _STOP_WORDS, not here:
+    # empty concept lists only bloated the dict and reverse-index scans
+    'into': ('toward', 'towards', 'to'),
+    # Modern technical terms
+    'llm': ('large language model', 'language model', 'ai model', 'neural network', 'machine learning', 'artificial intelligence'),
+    'transformer': ('transform', 'convert', 'change', 'modify', 'neural network', 'ai architecture', 'model'),
+    'attention': ('focus', 'concentration', 'awareness', 'mechanism', 'process', 'neural attention'),
+    'mechanism': ('process', 'method', 'system', 'function', 'operation', 'procedure'),
+    'mechanisms': ('processes', 'methods', 'systems', 'functions', 'operations', 'procedures'),
+    'natural': ('organic', 'normal', 'inherent', 'intrinsic', 'native'),
+    'language': ('speech', 'communication', 'tongue', 'dialect', 'linguistic'),
+    'processing': ('handling', 'managing', 'analyzing', 'computing', 'executing'),
+    'use': ('utilize', 'employ', 'apply', 'operate', 'function'),
+}
+
+# Context-based concept groups, kept as a raw module-level literal; instances
+# expose them as frozensets so membership tests are O(1) and the values carry
+# no list growth slack
+_CONTEXT_GROUPS_RAW = {
+    'legal': ['property', 'inheritance', 'debt', 'obligation', 'legal', 'contract',
+              'law', 'right', 'claim', 'ownership', 'estate', 'will', 'testament'],
+    'mathematical': ['fraction', 'calculation', 'mathematical', 'numerator',
+                     'denominator', 'divide', 'multiply', 'sum', 'number', 'count'],
+    'economic': ['resources', 'assets', 'wealth', 'property', 'distribution',
+                 'allocation', 'share', 'portion'],
+    'food': ['cake', 'food', 'dessert', 'meal', 'eating'],
+    'action': ['divide', 'share', 'distribute', 'allocate', 'split', 'separate'],
+    'technical': ['llm', 'transformer', 'attention', 'mechanism', 'processing', 'neural', 'ai', 'machine learning', 'artificial intelligence'],
+    'ai': ['artificial intelligence', 'machine learning', 'neural network', 'language model', 'transformer', 'attention mechanism']
+}
+
+# Derived lookup structures, built exactly once per process instead of per
+# instance: concept values as frozensets, the reverse concept -> keys index,
+# context values as frozensets, and the per-context single-word / phrase split
+_CONTEXT_GROUPS = {k: frozenset(v) for k, v in _CONTEXT_GROUPS_RAW.items()}
+_CONCEPTS_AS_SETS = {k: frozenset(v) for k, v in _SEMANTIC_CONCEPTS.items()}
+_REVERSE_INDEX = {}
+for _key, _values in _SEMANTIC_CONCEPTS.items():
+    for _value in _values:
+        _REVERSE_INDEX.setdefault(_value, set()).add(_key)
+_CONTEXT_SINGLE = {ctx: frozenset(w for w in words if ' ' not in w)
+                   for ctx, words in _CONTEXT_GROUPS_RAW.items()}
+_CONTEXT_PHRASES = {ctx: [w for w in words if ' ' in w]
+                    for ctx, words in _CONTEXT_GROUPS_RAW.items()}
+del _key, _values, _value
+
+# Flat multi-word phrase table for the context matcher: each distinct phrase
+# appears once with its first word and every context it belongs to, so one
+# pass covers all contexts and the substring search only runs when the first
+# word is already present in the token set
+_PHRASE_ENTRIES = []
+_phrase_ctxs = {}
+for _ctx, _words in _CONTEXT_GROUPS_RAW.items():
+    for _w in _words:
+        if ' ' in _w:
+            _phrase_ctxs.setdefault(_w, []).append(_ctx)
+for _w, _ctxs in _phrase_ctxs.items():
+    _PHRASE_ENTRIES.append((_w, _w.split(' ', 1)[0], tuple(_ctxs)))
+del _phrase_ctxs, _ctx, _words, _w, _ctxs
+
+
+def _build_expanded():
+    """Statically evaluate expand_word for every word the tables know about
+
+    The concept mapping is a fixed literal, so the full expansion closure -
+    direct concepts, reverse-mapped keys and their concepts - is computable
+    once at import. Everything outside this domain expands to itself.
+    """
+    expanded = {}
+    for word in set(_SEMANTIC_CONCEPTS) | set(_REVERSE_INDEX):
+        concepts = {word}
+        direct = _CONCEPTS_AS_SETS.get(word)
+        if direct:
+            concepts |= direct
+        for key in _REVERSE_INDEX.get(word, ()):
+            concepts.add(key)
+            concepts |= _CONCEPTS_AS_SETS[key]
+        expanded[word] = frozenset(sys.intern(c) for c in concepts)
+    return expanded
+
+
+# Precomputed expansions for every known word - the hot path becomes a single
+# dict lookup with no set construction
+_EXPANDED = _build_expanded()
+
+# Per-context keyword expansions, precomputed so the context matcher unions
+# ready-made frozensets instead of calling expand_word per matched keyword
+# (each expansion already contains the keyword itself)
+_CONTEXT_EXPANDED = {
+    ctx: {w: _EXPANDED.get(w) or frozenset((sys.intern(w),)) for w in words}
+    for ctx, words in _CONTEXT_GROUPS_RAW.items()
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _expand_word_cached(word_lower: str) -> frozenset:
+    """Cached expansion over the shared static tables
+
+    Module-level so every expander instance shares one C-implemented,
+    thread-safe cache. Known words hit the statically precomputed table;
+    anything else expands to itself (interned, so repeats share one
+    string object).
+    """
+    hit = _EXPANDED.get(word_lower)
+    if hit is not None:
+        return hit
+    return frozenset((sys.intern(word_lower),))
 
 class SemanticExpander:
     def __init__(self):
         """Initialize semantic expander with comprehensive synonym/concept mappings"""
-        # Cache for expand_word results (major performance improvement)
-        self._expand_cache = {}
-        
-        # Pre-build reverse index for faster reverse lookup
-        self._reverse_index = {}
-        self._reverse_index_built = False
-        
-        # Comprehensive semantic concept mappings
-        # Each word maps to its semantic concepts (synonyms, related meanings)
-        self.semantic_concepts = {
-            'divide': ['split', 'share', 'distribute', 'portion', 'division', 'allocation', 
-                      'separate', 'partition', 'apportion', 'allocate', 'parcel', 'section'],
-            'share': ['divide', 'distribute', 'portion', 'part', 'allot', 'allocate', 
-                     'apportion', 'parcel', 'division', 'split'],
-            'distribute': ['divide', 'share', 'allocate', 'apportion', 'dispense', 
-                          'allot', 'parcel', 'portion', 'divide up'],
-            'portion': ['part', 'share', 'division', 'segment', 'piece', 'fraction', 
-                       'allocation', 'allotment', 'quota'],
-            'part': ['portion', 'share', 'division', 'segment', 'piece', 'fraction', 
-                    'component', 'section'],
-            'property': ['possession', 'asset', 'ownership', 'estate', 'belonging', 
-                        'real estate', 'land', 'holding'],
-            'inheritance': ['heritage', 'legacy', 'estate', 'bequest', 'patrimony', 
-                          'endowment', 'succession'],
-            'fraction': ['portion', 'part', 'division', 'segment', 'piece', 
-                        'numerator', 'denominator'],
-            'calculate': ['compute', 'determine', 'figure', 'reckon', 'work out', 
-                         'estimate', 'assess'],
-            'mathematical': ['numeric', 'arithmetic', 'computational', 'quantitative', 
-                            'numerical'],
-            'free': ['liberate', 'release', 'unbound', 'unrestricted', 'unfettered'],
-            'obligation': ['debt', 'duty', 'responsibility', 'commitment', 'liability'],
-            'debt': ['obligation', 'liability', 'indebtedness', 'arrears'],
-            'resources': ['assets', 'materials', 'supplies', 'means', 'funds', 'wealth'],
-            'assets': ['resources', 'property', 'possessions', 'wealth', 'holdings'],
-            'fairly': ['equitably', 'justly', 'evenly', 'equally', 'impartially'],
-            'cake': ['food', 'dessert', 'sweet', 'pastry'],
-            'portions': ['parts', 'shares', 'divisions', 'segments', 'pieces'],
-            'how': ['method', 'way', 'manner', 'process', 'technique'],
-            'to': [],  # Stop word
-            'a': [],   # Stop word
-            'into': ['toward', 'towards', 'to'],
-            # Modern technical terms
-            'llm': ['large language model', 'language model', 'ai model', 'neural network', 'machine learning', 'artificial intelligence'],
-            'transformer': ['transform', 'convert', 'change', 'modify', 'neural network', 'ai architecture', 'model'],
-            'attention': ['focus', 'concentration', 'awareness', 'mechanism', 'process', 'neural attention'],
-            'mechanism': ['process', 'method', 'system', 'function', 'operation', 'procedure'],
-            'mechanisms': ['processes', 'methods', 'systems', 'functions', 'operations', 'procedures'],
-            'natural': ['organic', 'normal', 'inherent', 'intrinsic', 'native'],
-            'language': ['speech', 'communication', 'tongue', 'dialect', 'linguistic'],
-            'processing': ['handling', 'managing', 'analyzing', 'computing', 'executing'],
-            'use': ['utilize', 'employ', 'apply', 'operate', 'function'],
-            'for': [],  # Stop word
-        }
-        
-        # Context-based concept groups
-        self.context_groups = {
-            'legal': ['property', 'inheritance', 'debt', 'obligation', 'legal', 'contract', 
-                     'law', 'right', 'claim', 'ownership', 'estate', 'will', 'testament'],
-            'mathematical': ['fraction', 'calculation', 'mathematical', 'numerator', 
-                           'denominator', 'divide', 'multiply', 'sum', 'number', 'count'],
-            'economic': ['resources', 'assets', 'wealth', 'property', 'distribution', 
-                        'allocation', 'share', 'portion'],
-            'food': ['cake', 'food', 'dessert', 'meal', 'eating'],
-            'action': ['divide', 'share', 'distribute', 'allocate', 'split', 'separate'],
-            'technical': ['llm', 'transformer', 'attention', 'mechanism', 'processing', 'neural', 'ai', 'machine learning', 'artificial intelligence'],
-            'ai': ['artificial intelligence', 'machine learning', 'neural network', 'language model', 'transformer', 'attention mechanism']
-        }
-    
-    def _build_reverse_index(self):
-        """Build reverse index once for faster reverse lookups"""
-        if self._reverse_index_built:
-            return
+        # Shared reference to the module-level concept mapping
+        self.semantic_concepts = _SEMANTIC_CONCEPTS
         
-        for key, values in self.semantic_concepts.items():
-            for value in values:
-                if value not in self._reverse_index:
-                    self._reverse_index[value] = []
-                self._reverse_index[value].append(key)
-        
-        self._reverse_index_built = True
-    
+        # Context-based concept groups as frozensets (values are only ever
+        # membership-tested and iterated)
+        self.context_groups = _CONTEXT_GROUPS
+
+        # Shared references to the module-level derived structures: the
+        # concept-set table, reverse index and per-context single-word /
+        # phrase split are built once at import, not once per instance
+        self._concepts_as_sets = _CONCEPTS_AS_SETS
+        self._reverse_index = _REVERSE_INDEX
+        self._context_single = _CONTEXT_SINGLE
+        self._context_phrases = _CONTEXT_PHRASES
+
+        # Bounded LRU memoization of expand_word (major performance
+        # improvement); the cache lives at module level, shared by every
+        # instance since the tables it reads are process-wide constants
+        self._expand_cached = _expand_word_cached
+
     def expand_word(self, word: str) -> Set[str]:
         """
         Expand a single word to its semantic concepts
-        OPTIMIZED: Uses caching and pre-built reverse index
-        Returns: Set of semantic concepts
+        OPTIMIZED: Memoized through a bounded LRU cache; the returned
+        frozenset is immutable, so callers share one object per word
+        Returns: Frozenset of semantic concepts
         """
-        word_lower = word.lower().strip()
-        
-        # Check cache first
-        if word_lower in self._expand_cache:
-            return self._expand_cache[word_lower]
-        
-        # Build reverse index if not built
-        if not self._reverse_index_built:
-            self._build_reverse_index()
-        
-        # Direct lookup
-        concepts = set()
-        if word_lower in self.semantic_concepts:
-            concepts.update(self.semantic_concepts[word_lower])
-        
-        # Add the word itself
-        concepts.add(word_lower)
-        
-        # Reverse lookup using pre-built index (much faster than iterating)
-        if word_lower in self._reverse_index:
-            for key in self._reverse_index[word_lower]:
-                concepts.add(key)
-                if key in self.semantic_concepts:
-                    concepts.update(self.semantic_concepts[key])
-        
-        # Cache the result
-        self._expand_cache[word_lower] = concepts
-        
-        return concepts
-    
+        return self._expand_cached(word.lower().strip())
+
     def expand_text(self, text: str) -> Set[str]:
         """
         Expand entire text to semantic concepts
+        OPTIMIZED: Stop-word filtering is fused into the expansion loop so
+        no intermediate word list is materialized
         Returns: Set of all semantic concepts
         """
-        # Extract words
-        words = re.findall(r'\b[a-z]{2,}\b', text.lower())
-        
-        # Filter stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                     'of', 'with', 'by', 'from', 'as', 'is', 'are', 'was', 'were'}
-        words = [w for w in words if w not in stop_words]
-        
-        # Expand each word
-        all_concepts = set()
-        for word in words:
-            concepts = self.expand_word(word)
-            all_concepts.update(concepts)
-        
-        return all_concepts
+        return self._expand_text_impl(text.lower())
+
+    def _expand_text_impl(self, text_lower: str) -> Set[str]:
+        """Expansion over an already-lowercased string"""
+        # Tokens from the word pattern are already lowercase and stripped,
+        # so the cached expansion is invoked directly, skipping the
+        # normalizing wrapper; the expansions are frozensets, so one
+        # C-level union call merges them without a Python-level loop
+        expand = self._expand_cached
+        sw_contains = _STOP_WORDS.__contains__
+        return set().union(*(expand(word)
+                             for word in _WORD_RE.findall(text_lower)
+                             if not sw_contains(word)))
     
+    def expand_texts(self, texts: List[str]) -> List[Set[str]]:
+        """
+        Expand several texts in one call
+        OPTIMIZED: Batch entry point for callers that expand many short
+        strings in a loop (e.g. the scoring precompute pass) - the word
+        pattern, stop words and method lookups are bound once per batch
+        Returns: List of concept sets, one per input text
+        """
+        findall = _WORD_RE.findall
+        sw_contains = _STOP_WORDS.__contains__
+        expand = self._expand_cached
+
+        union = set().union
+        return [union(*(expand(word)
+                        for word in findall(text.lower())
+                        if not sw_contains(word)))
+                for text in texts]
+
     def get_context_concepts(self, text: str) -> Dict[str, Set[str]]:
         """
         Get context-specific concepts
         Returns: Dictionary mapping context types to relevant concepts
         """
-        text_lower = text.lower()
+        return self._get_context_concepts_impl(text.lower())
+
+    def _get_context_concepts_impl(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Context matching over an already-lowercased string"""
+        tokens = set(_WORD_RE.findall(text_lower))
         context_concepts = {}
-        
-        for context_type, context_words in self.context_groups.items():
-            matching_concepts = set()
-            for word in context_words:
-                if word in text_lower:
-                    matching_concepts.add(word)
-                    # Also add expanded concepts
-                    matching_concepts.update(self.expand_word(word))
-            
-            if matching_concepts:
-                context_concepts[context_type] = matching_concepts
-        
+
+        # Multi-word phrases: one pass over the distinct phrase table covers
+        # every context, and the token-set guard on the first word skips the
+        # substring search for phrases that cannot possibly match
+        phrase_hits = {}
+        for phrase, first_word, ctxs in _PHRASE_ENTRIES:
+            if first_word in tokens and phrase in text_lower:
+                for ctx in ctxs:
+                    phrase_hits.setdefault(ctx, []).append(phrase)
+
+        for context_type in self.context_groups:
+            # Single words: one C-level set intersection instead of a
+            # substring scan per context word (which also false-matched
+            # short words inside longer ones)
+            hits = tokens & self._context_single[context_type]
+            ctx_phrases = phrase_hits.get(context_type, ())
+
+            if hits or ctx_phrases:
+                # Union the precomputed keyword expansions (each includes the
+                # keyword itself) - zero per-call expansion work
+                expanded = _CONTEXT_EXPANDED[context_type]
+                context_concepts[context_type] = set().union(
+                    *(expanded[w] for w in hits),
+                    *(expanded[p] for p in ctx_phrases)
+                )
+
         return context_concepts
     
     def expand_with_context(self, text: str) -> Dict:
         """
         Expand text with context awareness
         Returns: {
-            'concepts': list of all concepts (converted from set for compatibility),
+            'concepts': tuple of all concepts (subscriptable, immutable),
             'contexts': dict of context-specific concepts,
             'primary_context': dominant context type
         }
         """
-        concepts = self.expand_text(text)
-        context_concepts = self.get_context_concepts(text)
+        # Lowercase the full input once and share it between both passes
+        # (two full-size copies otherwise, which hurts on large inputs)
+        text_lower = text.lower()
+        concepts = self._expand_text_impl(text_lower)
+        context_concepts = self._get_context_concepts_impl(text_lower)
         
-        # Determine primary context
-        primary_context = None
-        max_context_size = 0
-        for context_type, ctx_concepts in context_concepts.items():
-            if len(ctx_concepts) > max_context_size:
-                max_context_size = len(ctx_concepts)
-                primary_context = context_type
+        # Determine primary context: single C-level max over the items
+        primary_context, _ = max(
+            context_concepts.items(),
+            key=lambda kv: len(kv[1]),
+            default=(None, None)
+        )
         
-        # Convert set to list for compatibility (can be subscripted)
+        # A tuple stays subscriptable for existing callers but avoids the
+        # mutable list copy (callers only iterate, slice and take len)
         return {
-            'concepts': list(concepts),
+            'concepts': tuple(concepts),
             'contexts': context_concepts,
             'primary_context': primary_context
         }
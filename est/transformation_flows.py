@@ -6,7 +6,15 @@ Transformation Flows - Phrase transformations for low-scoring chunks
 import re
 from typing import List, Tuple, Dict
 
+# Connector alternation for split_phrase - one compiled pass replaces six
+# sequential substring scans ('into' ordered before 'to' so the longer
+# literal wins)
+_CONNECTORS_RE = re.compile(r'\s+(?:and|or|with|from|into|to)\s+')
+
 class TransformationFlows:
+    # Hoisted once: expand_phrase re-built this list per call
+    _MODIFIERS = ('how to', 'way to', 'method to', 'process of')
+
     def __init__(self):
         """Initialize transformation flows"""
         # Synonym mappings (basic - can be expanded)
@@ -20,6 +28,11 @@ class TransformationFlows:
             'calculate': ['compute', 'determine', 'figure', 'reckon'],
             'mathematical': ['numeric', 'arithmetic', 'computational'],
         }
+
+        # The transformation paths only ever use the first two synonyms;
+        # pre-slice into tuples once so the hot paths skip the per-call
+        # dict.get + list slice
+        self._synonyms_top2 = {k: tuple(v[:2]) for k, v in self.synonyms.items()}
     
     def transform_verb_object_pair(self, verb: str, obj: str) -> List[str]:
         """
@@ -38,14 +51,11 @@ class TransformationFlows:
         # Reverse order (object-verb)
         transformations.append(f"{obj} {verb}")
         
-        # Add synonyms
-        verb_synonyms = self.synonyms.get(verb, [])
-        obj_synonyms = self.synonyms.get(obj, [])
-        
-        for vs in verb_synonyms[:2]:  # Limit to 2 synonyms
+        # Add synonyms (pre-sliced to the 2-synonym limit at init)
+        for vs in self._synonyms_top2.get(verb, ()):
             transformations.append(f"{vs} {obj}")
         
-        for os in obj_synonyms[:2]:
+        for os in self._synonyms_top2.get(obj, ()):
             transformations.append(f"{verb} {os}")
         
         return transformations
@@ -72,20 +82,35 @@ class TransformationFlows:
         synonym_phrases = self.apply_synonyms(phrase)
         transformations.extend(synonym_phrases)
         
-        # Remove duplicates
-        return list(dict.fromkeys(transformations))
+        # Remove duplicates - an inline seen-set beats dict.fromkeys for
+        # these ~10-entry lists (no dict allocation, single pass)
+        seen = set()
+        out = []
+        for t in transformations:
+            if t not in seen:
+                seen.add(t)
+                out.append(t)
+        return out
     
     def apply_synonyms(self, phrase: str) -> List[str]:
         """Apply synonym replacements to phrase"""
         synonym_phrases = []
         words = phrase.split()
         
+        top2 = self._synonyms_top2
         for i, word in enumerate(words):
-            if word in self.synonyms:
-                for synonym in self.synonyms[word][:2]:  # Limit to 2 synonyms
-                    new_words = words.copy()
-                    new_words[i] = synonym
-                    synonym_phrases.append(' '.join(new_words))
+            synonyms = top2.get(word)
+            if synonyms:
+                # Join the unchanged halves once per position, not once per
+                # synonym (the old words.copy() + join re-walked the whole
+                # list for every replacement)
+                prefix = ' '.join(words[:i])
+                suffix = ' '.join(words[i + 1:])
+                for synonym in synonyms:
+                    synonym_phrases.append(
+                        f"{prefix} {synonym} {suffix}".strip()
+                        if prefix or suffix else synonym
+                    )
         
         return synonym_phrases
     
@@ -94,43 +119,32 @@ class TransformationFlows:
         Narrow phrase context by adding context words
         Returns: List of narrowed phrases
         """
-        narrowed = [phrase]
-        
-        for context in context_words[:3]:  # Limit to 3 context words
-            # Add context before phrase
-            narrowed.append(f"{context} {phrase}")
-            # Add context after phrase
-            narrowed.append(f"{phrase} {context}")
-        
-        return narrowed
+        # Slice to the 3-word limit once; the comprehensions run without
+        # per-iteration append dispatch
+        top3 = context_words[:3]
+        return [phrase,
+                *(f"{context} {phrase}" for context in top3),
+                *(f"{phrase} {context}" for context in top3)]
     
     def expand_phrase(self, phrase: str) -> List[str]:
         """
         Expand phrase with variations
         Returns: List of expanded phrases
         """
-        expansions = [phrase]
-        
-        # Add common modifiers
-        modifiers = ['how to', 'way to', 'method to', 'process of']
-        for modifier in modifiers:
-            if not phrase.startswith(modifier):
-                expansions.append(f"{modifier} {phrase}")
-        
-        return expansions
+        # Common modifiers come from the class-level tuple
+        return [phrase,
+                *(f"{modifier} {phrase}" for modifier in self._MODIFIERS
+                  if not phrase.startswith(modifier))]
     
     def split_phrase(self, phrase: str) -> List[str]:
         """
         Split phrase into components
         Returns: List of phrase components
         """
-        # Split by common connectors
-        connectors = [' and ', ' or ', ' with ', ' from ', ' into ', ' to ']
-        
-        for connector in connectors:
-            if connector in phrase:
-                parts = phrase.split(connector)
-                return [p.strip() for p in parts if p.strip()]
+        # Split by common connectors in one compiled-regex pass
+        parts = _CONNECTORS_RE.split(phrase)
+        if len(parts) > 1:
+            return [p.strip() for p in parts if p.strip()]
         
         # Split by spaces if long enough
         words = phrase.split()
@@ -3,58 +3,89 @@
 Generate semantic tree visualization from check_dictionary.csv semantic_frame column
 """
 
+import base64
 import csv
+import gzip
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
 
 def build_semantic_tree(csv_path):
     """Build semantic tree from semantic_frame column"""
     # Tree structure: root_concept -> {words: [], children: []}
-    tree = defaultdict(lambda: {'words': [], 'children': defaultdict(list)})
-    all_concepts = set()
+    tree = defaultdict(lambda: {'words': [], 'children': {}})
     
     print("Building semantic tree from semantic_frame column...")
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    # Large read buffer amortizes syscalls across the multi-MB file
+    with open(csv_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        # csv.reader with positional indexing resolved once from the header:
+        # skips the per-row dict allocation and string-keyed lookups that
+        # DictReader pays on every row
+        reader = csv.reader(f)
+        header = next(reader)
+        col = {name: i for i, name in enumerate(header)}
+        i_sans = col['sanskrit']
+        i_frame = col['semantic_frame']
+        i_eng = col['english']
+        n_cols = len(header)
+
         count = 0
-        
+
+        # Rows frequently share the same semantic_frame string; memoize the
+        # parsed concept tuple per raw frame so repeats skip the split,
+        # strip and intern work entirely
+        frame_cache = {}
+
         for row in reader:
-            sanskrit = row.get('sanskrit', '').strip()
-            semantic_frame = row.get('semantic_frame', '').strip()
-            english = row.get('english', '').strip()
+            if len(row) < n_cols:
+                # Pad short rows so positional indexing stays safe
+                row = row + [''] * (n_cols - len(row))
+            sanskrit = row[i_sans].strip()
+            semantic_frame = row[i_frame].strip()
             
             if semantic_frame and sanskrit:
                 # Parse semantic_frame - pipe-separated concepts
                 # Format: "root_concept | child1 | child2 | ..."
-                parts = [p.strip() for p in semantic_frame.split('|') if p.strip()]
+                # Concepts repeat across thousands of rows; interning makes
+                # equal concepts share one object, so the tree and concept-set
+                # hashing hits the pointer-identity fast path
+                parts = frame_cache.get(semantic_frame)
+                if parts is None:
+                    parts = tuple(
+                        sys.intern(p)
+                        for p in map(str.strip, semantic_frame.split('|')) if p
+                    )
+                    frame_cache[semantic_frame] = parts
                 
                 if parts:
                     root = parts[0]
-                    all_concepts.add(root)
                     
-                    # Add word to root node
-                    tree[root]['words'].append({
-                        'sanskrit': sanskrit,
-                        'english': english[:80]  # Truncate
-                    })
+                    # Add word to root node as a (sanskrit, english) tuple -
+                    # a fraction of the per-word footprint of a two-key dict
+                    tree[root]['words'].append(
+                        (sanskrit, row[i_eng].strip()[:80])  # english truncated
+                    )
                     
-                    # Build parent-child relationships
-                    for i in range(len(parts) - 1):
-                        parent = parts[i]
-                        child = parts[i + 1]
-                        all_concepts.add(child)
-                        
-                        # Add child to parent's children
-                        if child not in tree[parent]['children']:
-                            tree[parent]['children'][child] = []
-                        tree[parent]['children'][child].append(sanskrit)
+                    # Build parent-child relationships: pair up adjacent
+                    # concepts and hash the parent node once per edge
+                    for parent, child in zip(parts, parts[1:]):
+                        tree[parent]['children'].setdefault(child, []).append(sanskrit)
             
             count += 1
-            if count % 5000 == 0:
-                print(f"  Processed {count} rows...")
+            # Progress goes to stderr at a coarse interval - frequent stdout
+            # prints force flush syscalls inside the hot loop
+            if count % 100000 == 0:
+                print(f"  Processed {count} rows...", file=sys.stderr)
     
+    # Fold the concept set in bulk after the scan instead of two hash adds
+    # per edge inside the hot loop: every concept is either a tree key or a
+    # child of one
+    all_concepts = set(tree)
+    for node in tree.values():
+        all_concepts.update(node['children'])
+
     print(f"\n✅ Tree built from {count} rows")
     print(f"   Unique concepts: {len(all_concepts)}")
     print(f"   Root nodes: {len(tree)}")
@@ -62,109 +93,49 @@ def build_semantic_tree(csv_path):
     
     return dict(tree), all_concepts
 
-def generate_html_tree(tree_data, all_concepts, output_path):
-    """Generate interactive HTML tree visualization using D3.js"""
-    
-    # Prepare simplified tree structure for visualization
-    # Focus on top nodes by word count
-    sorted_roots = sorted(
-        tree_data.items(), 
-        key=lambda x: len(x[1]['words']), 
-        reverse=True
-    )[:100]  # Top 100 roots
-    
-    # Build hierarchy
-    nodes_list = []
-    links_list = []
-    node_id_map = {}
-    node_counter = 1
-    
-    # Create nodes
-    for root, data in sorted_roots:
-        if root not in node_id_map:
-            node_id_map[root] = node_counter
-            nodes_list.append({
-                'id': node_counter,
-                'name': root[:50],  # Truncate long names
-                'word_count': len(data['words']),
-                'level': 0
-            })
-            node_counter += 1
-        
-        # Add children
-        for child, words in list(data['children'].items())[:5]:  # Top 5 children
-            if child not in node_id_map:
-                node_id_map[child] = node_counter
-                nodes_list.append({
-                    'id': node_counter,
-                    'name': child[:50],
-                    'word_count': len(words),
-                    'level': 1
-                })
-                node_counter += 1
-            
-            # Create link
-            links_list.append({
-                'source': node_id_map[root],
-                'target': node_id_map[child]
-            })
-    
-    html_content = f"""<!DOCTYPE html>
+# Static HTML fragments for the tree page, written around the two JSON
+# payloads - plain strings need no brace escaping for the CSS/JS blocks
+# and the page streams to the file instead of one giant f-string
+_HTML_PART1 = """<!DOCTYPE html>
 <html>
 <head>
     <title>EST Semantic Tree Visualization</title>
     <script src="https://d3js.org/d3.v7.min.js"></script>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #0f172a, #1e293b);
             color: #e2e8f0;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1800px;
             margin: 0 auto;
-        }}
-        h1 {{
+        }
+        h1 {
             text-align: center;
             color: #7dd3fc;
             margin-bottom: 10px;
-        }}
-        .subtitle {{
+        }
+        .subtitle {
             text-align: center;
             color: #94a3b8;
             margin-bottom: 30px;
             font-size: 14px;
-        }}
-        .tree-container {{
+        }
+        .tree-container {
             background: rgba(30, 41, 59, 0.7);
             border-radius: 16px;
             padding: 20px;
             box-shadow: 0 8px 32px rgba(2, 8, 20, 0.4);
             overflow: auto;
-        }}
-        .node circle {{
-            fill: #7dd3fc;
-            stroke: #0ea5e9;
-            stroke-width: 2px;
+        }
+        #tree-canvas {
             cursor: pointer;
-        }}
-        .node text {{
-            font-size: 11px;
-            fill: #e2e8f0;
-            pointer-events: none;
-        }}
-        .link {{
-            fill: none;
-            stroke: #475569;
-            stroke-width: 1.5px;
-        }}
-        .node:hover circle {{
-            fill: #fbbf24;
-            stroke: #f59e0b;
-        }}
-        .tooltip {{
+            display: block;
+        }
+        .tooltip {
             position: absolute;
             background: rgba(15, 23, 42, 0.95);
             border: 1px solid #7dd3fc;
@@ -176,12 +147,12 @@ def generate_html_tree(tree_data, all_concepts, output_path):
             display: none;
             max-width: 300px;
             z-index: 1000;
-        }}
-        .stats {{
+        }
+        .stats {
             text-align: center;
             color: #94a3b8;
             margin-bottom: 20px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -189,143 +160,312 @@ def generate_html_tree(tree_data, all_concepts, output_path):
         <h1>🕉️ EST Semantic Tree Visualization</h1>
         <div class="subtitle">Semantic concept hierarchy from check_dictionary.csv</div>
         <div class="stats">
-            <strong>Total Nodes:</strong> {len(nodes_list)} | 
-            <strong>Total Links:</strong> {len(links_list)} | 
+            <strong>Total Nodes:</strong> """
+
+_HTML_PART2 = """ | 
+            <strong>Total Links:</strong> """
+
+_HTML_PART3 = """ | 
             <strong>Top 100 Root Concepts</strong>
         </div>
         <div class="tree-container">
-            <svg id="tree-svg" width="1700" height="1200"></svg>
+            <canvas id="tree-canvas" width="1700" height="1200"></canvas>
         </div>
     </div>
     
     <div class="tooltip" id="tooltip"></div>
     
     <script>
-        const nodes = {json.dumps(nodes_list)};
-        const links = {json.dumps(links_list)};
-        
-        const svg = d3.select("#tree-svg");
+        const payloadB64 = """
+
+_HTML_PART5 = """;
+
+        (async () => {
+
+        // The node/link payload ships gzip-compressed and base64-encoded;
+        // DecompressionStream restores it at load, so the page stays small
+        // while JSON.parse still runs at C speed on the expanded text
+        const payloadBytes = Uint8Array.from(atob(payloadB64), c => c.charCodeAt(0));
+        const payloadText = await new Response(
+            new Blob([payloadBytes]).stream().pipeThrough(new DecompressionStream("gzip"))
+        ).text();
+        const {nodes, links} = JSON.parse(payloadText);
+
+        // Canvas rendering: one draw pass instead of an SVG DOM node per
+        // circle/text/path, which stops scaling past a few hundred nodes
+        const canvas = document.getElementById("tree-canvas");
+        const ctx = canvas.getContext("2d");
         const width = 1700;
         const height = 1200;
         const tooltip = d3.select("#tooltip");
-        
-        // Create tree layout
-        const tree = d3.tree()
-            .size([height - 150, width - 300]);
-        
-        // Build hierarchy
-        const nodeMap = new Map();
-        nodes.forEach(d => {{
-            nodeMap.set(d.id, {{...d, children: []}});
-        }});
-        
-        // Build tree structure
-        const rootNodes = nodes.filter(d => d.level === 0);
-        const rootData = {{id: 0, name: "Semantic Roots", children: []}};
-        
-        rootNodes.forEach(root => {{
-            const rootNode = nodeMap.get(root.id);
-            // Find children
-            links.forEach(link => {{
-                if (link.source === root.id) {{
-                    const child = nodeMap.get(link.target);
-                    if (child && !rootNode.children.includes(child)) {{
-                        rootNode.children.push(child);
-                    }}
-                }}
-            }});
-            rootData.children.push(rootNode);
-        }});
-        
-        const root = d3.hierarchy(rootData);
-        tree(root);
-        
-        // Draw links
-        svg.selectAll(".link")
-            .data(root.links())
-            .enter()
-            .append("path")
-            .attr("class", "link")
-            .attr("d", d3.linkHorizontal()
-                .x(d => d.y + 150)
-                .y(d => d.x + 75));
-        
-        // Draw nodes
-        const node = svg.selectAll(".node")
-            .data(root.descendants().filter(d => d.data.id !== 0))
-            .enter()
-            .append("g")
-            .attr("class", "node")
-            .attr("transform", d => `translate(${{d.y + 150}},${{d.x + 75}})`);
-        
-        node.append("circle")
-            .attr("r", d => Math.min(Math.sqrt(d.data.word_count || 1) * 2 + 8, 25))
-            .on("mouseover", function(event, d) {{
+
+        // Layout coordinates are precomputed server-side and the payload is
+        // columnar (one array per field), so reconstruction is a single loop
+        // with no d3.tree() pass or hierarchy build
+        const nodeById = new Map();
+        const drawNodes = nodes.id.map((id, i) => {
+            const d = {
+                data: {
+                    id: id,
+                    name: nodes.name[i],
+                    word_count: nodes.word_count[i],
+                    level: nodes.level[i]
+                },
+                px: nodes.y[i] + 150,
+                py: nodes.x[i] + 75,
+                r: Math.min(Math.sqrt(nodes.word_count[i] || 1) * 2 + 8, 25),
+                hasChildren: false
+            };
+            nodeById.set(id, d);
+            return d;
+        });
+
+        const drawLinks = links.source.map((s, i) => ({
+            source: nodeById.get(s),
+            target: nodeById.get(links.target[i])
+        }));
+        drawLinks.forEach(l => { l.source.hasChildren = true; });
+
+        function draw(highlight) {
+            ctx.clearRect(0, 0, width, height);
+
+            // Links
+            ctx.strokeStyle = "#475569";
+            ctx.lineWidth = 1.5;
+            ctx.beginPath();
+            const linkGen = d3.linkHorizontal()
+                .x(d => d.px)
+                .y(d => d.py)
+                .context(ctx);
+            drawLinks.forEach(linkGen);
+            ctx.stroke();
+
+            // Nodes
+            drawNodes.forEach(d => {
+                ctx.beginPath();
+                ctx.arc(d.px, d.py, d.r, 0, 2 * Math.PI);
+                ctx.fillStyle = d === highlight ? "#fbbf24" : "#7dd3fc";
+                ctx.strokeStyle = d === highlight ? "#f59e0b" : "#0ea5e9";
+                ctx.lineWidth = 2;
+                ctx.fill();
+                ctx.stroke();
+            });
+
+            // Labels
+            ctx.font = "11px 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif";
+            ctx.fillStyle = "#e2e8f0";
+            ctx.textBaseline = "middle";
+            drawNodes.forEach(d => {
+                const label = d.data.name.length > 25 ? d.data.name.substring(0, 22) + "..." : d.data.name;
+                if (d.hasChildren) {
+                    ctx.textAlign = "end";
+                    ctx.fillText(label, d.px - 15, d.py);
+                } else {
+                    ctx.textAlign = "start";
+                    ctx.fillText(label, d.px + 15, d.py);
+                }
+            });
+        }
+
+        // Quadtree over node positions for O(log n) hover hit-testing
+        const quadtree = d3.quadtree()
+            .x(d => d.px)
+            .y(d => d.py)
+            .addAll(drawNodes);
+
+        let hovered = null;
+        canvas.addEventListener("mousemove", event => {
+            const rect = canvas.getBoundingClientRect();
+            const mx = event.clientX - rect.left;
+            const my = event.clientY - rect.top;
+            const d = quadtree.find(mx, my, 30);
+            const hit = (d && Math.hypot(d.px - mx, d.py - my) <= d.r) ? d : null;
+
+            if (hit) {
                 tooltip.style("display", "block")
-                    .html(`<strong>${{d.data.name}}</strong><br/>Words: ${{d.data.word_count || 0}}<br/>Level: ${{d.data.level}}`)
+                    .html(`<strong>${hit.data.name}</strong><br/>Words: ${hit.data.word_count || 0}<br/>Level: ${hit.data.level}`)
                     .style("left", (event.pageX + 15) + "px")
                     .style("top", (event.pageY - 10) + "px");
-            }})
-            .on("mouseout", function() {{
+            } else {
                 tooltip.style("display", "none");
-            }});
-        
-        node.append("text")
-            .attr("dy", ".35em")
-            .attr("x", d => d.children ? -15 : 15)
-            .style("text-anchor", d => d.children ? "end" : "start")
-            .text(d => d.data.name.length > 25 ? d.data.name.substring(0, 22) + "..." : d.data.name);
+            }
+
+            // Redraw only when the highlighted node actually changes
+            if (hit !== hovered) {
+                hovered = hit;
+                draw(hovered);
+            }
+        });
+        canvas.addEventListener("mouseleave", () => {
+            tooltip.style("display", "none");
+            if (hovered !== null) {
+                hovered = null;
+                draw(null);
+            }
+        });
+
+        draw(null);
+
+        })();
     </script>
 </body>
 </html>
 """
+
+def generate_html_tree(sorted_roots, all_concepts, output_path):
+    """Generate interactive HTML tree visualization using D3.js
+
+    Takes the roots pre-sorted by word count (descending) so the sort is
+    paid once in main rather than per emit path
+    """
+    # Focus on top nodes by word count
+    sorted_roots = sorted_roots[:100]  # Top 100 roots
+    
+    # Build hierarchy - ids come from the map size via setdefault, so each
+    # node costs one hash instead of a membership test plus an insert, and
+    # the separate counter goes away
+    nodes_list = []
+    links_list = []
+    node_id_map = {}
+
+    # Create nodes
+    for root, data in sorted_roots:
+        size = len(node_id_map)
+        root_id = node_id_map.setdefault(root, size + 1)
+        if len(node_id_map) != size:  # newly assigned
+            nodes_list.append({
+                'id': root_id,
+                'name': root[:50],  # Truncate long names
+                'word_count': len(data['words']),
+                'level': 0
+            })
+
+        # Add children
+        for child, words in list(data['children'].items())[:5]:  # Top 5 children
+            size = len(node_id_map)
+            child_id = node_id_map.setdefault(child, size + 1)
+            if len(node_id_map) != size:
+                nodes_list.append({
+                    'id': child_id,
+                    'name': child[:50],
+                    'word_count': len(words),
+                    'level': 1
+                })
+
+            # Create link
+            links_list.append({
+                'source': root_id,
+                'target': child_id
+            })
     
+    # Precompute the tidy-tree layout server-side so the browser skips the
+    # d3.tree() pass and the client-side hierarchy build entirely: leaves get
+    # evenly spaced vertical slots, parents sit at the mean of their children,
+    # and depth fixes the horizontal band (matching the old on-load layout)
+    children_of = {}
+    for link in links_list:
+        children_of.setdefault(link['source'], []).append(link['target'])
+
+    layout_h, layout_w = 1050, 1400  # drawable extent inside the 1700x1200 canvas
+
+    # A concept can be both someone's child and a root (shared node ids), so
+    # classify by link role rather than level: nodes that are never a link
+    # source are the leaves and get the evenly spaced slots; sources are then
+    # centered on their placed children
+    sources = set(children_of)
+    leaf_count = sum(1 for n in nodes_list if n['id'] not in sources)
+    spacing = layout_h / max(1, leaf_count - 1)
+
+    x_pos = {}
+    slot = 0
+    for n in nodes_list:
+        if n['id'] not in sources:
+            x_pos[n['id']] = slot * spacing
+            slot += 1
+    for n in nodes_list:
+        nid = n['id']
+        if nid in sources:
+            kids = [k for k in children_of[nid] if k in x_pos]
+            if kids:
+                x_pos[nid] = sum(x_pos[k] for k in kids) / len(kids)
+            else:
+                x_pos[nid] = slot * spacing
+                slot += 1
+
+    for n in nodes_list:
+        n['x'] = round(x_pos[n['id']], 2)
+        n['y'] = layout_w // 2 if n['level'] == 0 else layout_w
+
+    # Columnar payloads: one key per field instead of re-serializing the
+    # same four-to-six key strings for every node/link, shrinking the
+    # embedded JSON and the browser-side parse proportionally
+    nodes_cols = {
+        'id': [n['id'] for n in nodes_list],
+        'name': [n['name'] for n in nodes_list],
+        'word_count': [n['word_count'] for n in nodes_list],
+        'level': [n['level'] for n in nodes_list],
+        'x': [n['x'] for n in nodes_list],
+        'y': [n['y'] for n in nodes_list],
+    }
+    links_cols = {
+        'source': [l['source'] for l in links_list],
+        'target': [l['target'] for l in links_list],
+    }
+
+    # Gzip the combined payload and embed it as base64 - the JSON
+    # compresses well, so the page shrinks several-fold
+    payload = json.dumps({'nodes': nodes_cols, 'links': links_cols},
+                         separators=(',', ':'))
+    payload_b64 = base64.b64encode(gzip.compress(payload.encode('utf-8'))).decode('ascii')
+
+    # Stream the page: static fragments plus the compressed payload are
+    # written directly to the file, avoiding one multi-megabyte string
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(_HTML_PART1)
+        f.write(str(len(nodes_list)))
+        f.write(_HTML_PART2)
+        f.write(str(len(links_list)))
+        f.write(_HTML_PART3)
+        f.write('"')
+        f.write(payload_b64)
+        f.write('"')
+        f.write(_HTML_PART5)
     
     print(f"✅ HTML tree visualization generated: {output_path}")
 
-def generate_text_tree(tree_data, root_nodes, output_path):
-    """Generate text-based tree visualization"""
-    
-    output = []
-    output.append("=" * 100)
-    output.append("EST SEMANTIC TREE VISUALIZATION")
-    output.append("=" * 100)
-    output.append(f"\nTotal Root Concepts: {len(tree_data)}")
-    output.append(f"Total Unique Concepts: {len(root_nodes)}")
-    output.append("\n" + "=" * 100 + "\n")
-    
-    # Show top nodes by word count
-    sorted_roots = sorted(
-        tree_data.items(), 
-        key=lambda x: len(x[1]['words']), 
-        reverse=True
-    )
+def generate_text_tree(sorted_roots, all_concepts, output_path):
+    """Generate text-based tree visualization from the pre-sorted roots"""
     
-    for i, (root, data) in enumerate(sorted_roots[:100], 1):  # Top 100
-        words = data['words']
-        children = list(data['children'].keys())
+    # Stream lines straight to the file (large buffer amortizes syscalls)
+    # instead of accumulating them all and joining into a second full-size
+    # string
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write = f.write
+        write("=" * 100 + "\n")
+        write("EST SEMANTIC TREE VISUALIZATION\n")
+        write("=" * 100 + "\n")
+        write(f"\nTotal Root Concepts: {len(sorted_roots)}\n")
+        write(f"Total Unique Concepts: {len(all_concepts)}\n")
+        write("\n" + "=" * 100 + "\n\n")
         
-        output.append(f"\n[{i}] {root}")
-        output.append(f"    📚 Words: {len(words)}")
-        
-        if words:
-            output.append(f"    Sample Sanskrit words:")
-            for word in words[:5]:
-                sanskrit = word['sanskrit']
-                english = word['english'][:70]
-                output.append(f"      • {sanskrit}: {english}")
-        
-        if children:
-            output.append(f"    🌿 Child concepts ({len(children)}): {', '.join(children[:8])}")
-            if len(children) > 8:
-                output.append(f"      ... and {len(children) - 8} more")
-        
-        output.append("")
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(output))
+        for i, (root, data) in enumerate(sorted_roots[:100], 1):  # Top 100
+            words = data['words']
+            children = list(data['children'].keys())
+            
+            write(f"\n[{i}] {root}\n")
+            write(f"    📚 Words: {len(words)}\n")
+            
+            if words:
+                write(f"    Sample Sanskrit words:\n")
+                for sanskrit, english in words[:5]:
+                    write(f"      • {sanskrit}: {english[:70]}\n")
+            
+            if children:
+                write(f"    🌿 Child concepts ({len(children)}): {', '.join(children[:8])}\n")
+                if len(children) > 8:
+                    write(f"      ... and {len(children) - 8} more\n")
+            
+            write("\n")
     
     print(f"✅ Text tree visualization generated: {output_path}")
 
@@ -339,9 +479,16 @@ def main():
     # Build tree
     tree_data, all_concepts = build_semantic_tree(csv_path)
     
+    # Sort the roots by word count once; every emit path slices this list
+    sorted_roots = sorted(
+        tree_data.items(), 
+        key=lambda x: len(x[1]['words']), 
+        reverse=True
+    )
+    
     # Generate visualizations
-    generate_html_tree(tree_data, all_concepts, 'semantic_tree.html')
-    generate_text_tree(tree_data, all_concepts, 'semantic_tree.txt')
+    generate_html_tree(sorted_roots, all_concepts, 'semantic_tree.html')
+    generate_text_tree(sorted_roots, all_concepts, 'semantic_tree.txt')
     
     # Save JSON data (sample)
     tree_json = {
@@ -351,15 +498,13 @@ def main():
             {
                 'concept': root,
                 'word_count': len(data['words']),
-                'sample_words': data['words'][:3],
+                # Word tuples become dicts only at emit time
+                'sample_words': [{'sanskrit': sk, 'english': en}
+                                 for sk, en in data['words'][:3]],
                 'children_count': len(data['children']),
                 'sample_children': list(data['children'].keys())[:5]
             }
-            for root, data in sorted(
-                tree_data.items(), 
-                key=lambda x: len(x[1]['words']), 
-                reverse=True
-            )[:50]
+            for root, data in sorted_roots[:50]
         ]
     }
     